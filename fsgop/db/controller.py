@@ -1,6 +1,8 @@
 from typing import Iterable, Dict, List, Optional, Union, Iterator, Tuple
+from typing import Callable, Hashable
 from difflib import SequenceMatcher
-from collections import namedtuple
+from collections import namedtuple, defaultdict
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 
@@ -23,6 +25,21 @@ CREW = [
 ]
 
 
+def person_block(person: Person) -> Optional[tuple]:
+    """Blocking key for fuzzy matching of persons
+
+    Args:
+        person: Person to create key for
+
+    Returns:
+        Tuple containing the year of birth and the case folded initial of the
+        last name or ``None``, if either of them is unknown.
+    """
+    if person.birthday is None or not person.last_name:
+        return None
+    return person.birthday.year, person.last_name[:1].casefold()
+
+
 class Controller(object):
     def __init__(self, repo: Union[Repository, str, Path]) -> None:
         if isinstance(repo, Repository):
@@ -259,7 +276,9 @@ class Controller(object):
     @staticmethod
     def match(l1: Iterable[Record],
               l2: Iterable[Record],
-              threshold: float = 0.) -> List[Match]:
+              threshold: float = 0.,
+              block: Optional[Callable[[Record], Hashable]] = None
+              ) -> List[Match]:
         """Match records from one sequence to those of another using index tuples
 
         Attempts to match each record in sequence 1 to a matching record in
@@ -271,6 +290,11 @@ class Controller(object):
             threshold: Float value in the range [0., 1] controlling match
                 accuracy. A value of 1. will require exact matches, while a
                 value of zero will attempt to always find a match.
+            block: Optional function returning a blocking key for a record,
+                e.g. :func:`person_block`. If provided, records without exact
+                match are only compared to records with the same key. Records
+                with key ``None`` are compared to all records. Defaults to
+                ``None``, which compares all records with each other.
 
         Returns:
             Iterable of tuples. Each tuple contains:
@@ -295,16 +319,37 @@ class Controller(object):
         if idx1 and idx2 and threshold < 1.:
             # try to find additional matches using difflib
             diff = SequenceMatcher(autojunk=False)
+            blocks = defaultdict(list)
+            if block is not None:
+                for k, v in idx2.items():
+                    blocks[block(v)].append(k)
             for idx, rec in idx1.items():
                 if not idx2:
                     break
+                key = block(rec) if block is not None else None
+                if key is None:
+                    candidates = idx2.keys()
+                else:
+                    candidates = [k for k in chain(blocks.get(key, ()),
+                                                   blocks.get(None, ()))
+                                  if k in idx2]
+                    if not candidates:
+                        continue
                 diff.set_seq2(idx)
-                # "or" in next line allows execution of two statements
-                tmp = max((diff.set_seq1(k) or diff.ratio(), k, v)
-                          for k, v in idx2.items())
-                if tmp[0] >= threshold:
-                    matches[idx] = (rec, tmp[2])
-                    idx2.pop(tmp[1])
+                best, best_k = -1., None
+                for k in candidates:
+                    diff.set_seq1(k)
+                    # skip the full comparison, if upper bounds of the ratio
+                    # rule out a better match
+                    lower = max(best, threshold)
+                    if (diff.real_quick_ratio() < lower
+                            or diff.quick_ratio() < lower):
+                        continue
+                    r = diff.ratio()
+                    if r >= threshold and (r, k) > (best, best_k or ""):
+                        best, best_k = r, k
+                if best_k is not None:
+                    matches[idx] = (rec, idx2.pop(best_k))
 
             unmatched = idx1.keys() - matches.keys()
             idx1 = {k: idx1[k] for k in unmatched}
@@ -121,7 +121,7 @@ class Database(object):
             schema: Schema dictionary
         """
         if schema is None:
-            # use to_schema to create a deep copy -> delete modifies self.schema
+            # use to_schema to create a copy -> delete modifies self.schema
             _schema = dict() if self.schema is None else to_schema(self.schema)
         else:
             _schema = to_schema(schema)
@@ -147,11 +147,13 @@ class Database(object):
         _force = "" if force else " IF NOT EXISTS"
         _name = table_info.name
         logger.debug(f"Creating table '{_name}'{_force} ...")
-        _cols = ",".join(f"{col.name} {col.dtype}"
+        _cols = ",".join(f"{col.name} {dtype}"
                          f"{'' if col.allows_null else ' NOT NULL'} "
-                         f"DEFAULT {col.default()}"
+                         f"DEFAULT {default}"
                          f"{col.sql_references()}"
-                         for col in table_info)
+                         for col, dtype, default in zip(table_info,
+                                                        table_info.dtypes,
+                                                        table_info.defaults))
         _key = table_info.primary_key()
         cursor = self._db.cursor()
         cursor.execute(f"CREATE TABLE{_force} {_name}({_cols}, {_key})")
@@ -76,6 +76,11 @@ class Mission(Record):
         charge_person: Member to charge or a negative constant
         comments: Eventual comments
     """
+    __slots__ = ("vehicle", "pilot", "copilot", "passenger1", "passenger2",
+                 "passenger3", "passenger4", "category", "num_stints",
+                 "launch", "origin", "begin", "destination", "end",
+                 "off_block_utc", "on_block_utc", "engine_hours_begin",
+                 "engine_hours_end", "charge_person", "comments")
     index = ["begin", "vehicle"]
     winch_launch_keys = {"WS", "W"}
     aerotow_keys = {"AT", "FS", "F"}
@@ -4,7 +4,7 @@ import re
 
 from .record import Record, to
 from .property import Property
-from .utils import ASCII
+from .utils import ascii_fold
 
 COUNTER_PATTERN = re.compile(r"(.+)\((\d+)\)")
 TITLE_PATTERN = re.compile(r"(Prof|Dr|rer|nat|phil|jur|med|Ing|M.Sc)\.-?\s*")
@@ -74,6 +74,8 @@ class Person(Record):
             person, but organizations are possible, too.
         comments: Comments field.
     """
+    __slots__ = ("last_name", "first_name", "title", "birthday", "birthplace",
+                 "count", "kind", "comments")
     index = ["last_name", "first_name", "count"]
 
     def __init__(self,
@@ -116,7 +118,7 @@ class Person(Record):
         s = f"{s1}.{s2}" if s1 and s2 else f"{s1 or s2}"
         if self.count > 1:
             s = f"{s}_{self.count}"
-        return s.translate(ASCII)
+        return ascii_fold(s)
 
     @property
     def name(self):
@@ -182,6 +184,7 @@ class PersonProperty(Property):
         kind: Kind of this property
         value: Property value
     """
+    __slots__ = ()
     index = [x if x != "rec" else "person" for x in Property.index]
 
     def __init__(self,
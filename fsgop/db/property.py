@@ -18,6 +18,7 @@ class Property(Record):
         kind: String describing the kind of this property
         value: Property value
     """
+    __slots__ = ("rec", "valid_from", "valid_until", "kind", "value")
     index = ["rec", "kind", "valid_until", "value"]
 
     def __init__(self,
@@ -2,6 +2,8 @@ from typing import Union, Optional, Type, Iterable, Iterator
 from collections import namedtuple
 from inspect import signature
 from datetime import datetime, date, time
+from operator import attrgetter
+from functools import lru_cache
 from .utils import to
 
 
@@ -23,13 +25,102 @@ def _to(obj, cls):
     raise TypeError(f"Unable to convert {obj} to {cls}")
 
 
+def _tuple_getter(names: Iterable[str]):
+    """Create a function returning a tuple of attributes
+
+    Args:
+        names: Names of the attributes to return
+
+    Returns:
+        Unary function returning a tuple containing the named attributes of its
+        argument
+    """
+    names = tuple(names)
+    if not names:
+        return lambda obj: ()
+    if len(names) == 1:
+        get = attrgetter(names[0])
+        return lambda obj: (get(obj),)
+    return attrgetter(*names)
+
+
+@lru_cache(maxsize=None)
+def _parameter_names(cls: type) -> tuple:
+    """Get names of all arguments accepted by the constructor of a class
+
+    Results are cached, since inspecting the signature is expensive and the
+    same classes are inspected over and over again.
+
+    Args:
+        cls: Class to inspect
+
+    Returns:
+        Tuple containing the argument names in order of declaration
+    """
+    return tuple(signature(cls).parameters.keys())
+
+
+# type -> names of all slots declared in its class hierarchy
+_SLOT_NAMES = dict()
+
+
+def _slot_names(cls: type) -> tuple:
+    """Get names of all slots of a class including those of its bases
+
+    Args:
+        cls: Class to inspect
+
+    Returns:
+        Tuple of slot names ordered from base to derived class
+    """
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = []
+        for c in reversed(cls.__mro__):
+            slots = c.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names.extend(x for x in slots
+                         if x not in ("__dict__", "__weakref__"))
+        names = _SLOT_NAMES[cls] = tuple(names)
+    return names
+
+
+def _members(obj) -> Iterator[tuple]:
+    """Iterate over all instance attributes of an object
+
+    Unlike :func:`vars` this works for objects with ``__slots__``, too.
+
+    Args:
+        obj: Object whose attributes to iterate
+
+    Yields:
+        Tuple containing name and value of each attribute. Unassigned slots
+        are skipped.
+    """
+    for name in _slot_names(type(obj)):
+        try:
+            yield name, getattr(obj, name)
+        except AttributeError:
+            pass
+    members = getattr(obj, "__dict__", None)
+    if members is not None:
+        yield from members.items()
+
+
 class Record(object):
     """Base class for records in a table
 
     Args:
         uid: Unique integer id of this record. Defaults to ``None``
     """
+    __slots__ = ("uid", "_properties")
     index = []
+    _index_getter = staticmethod(_tuple_getter(index))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._index_getter = staticmethod(_tuple_getter(cls.index))
 
     def __init__(self, uid: Optional[int] = None):
         self.uid = to(int, uid, default=None)
@@ -132,7 +223,7 @@ class Record(object):
         """
         if isinstance(self, cls):
             yield "", self
-        for k, v in vars(self).items():
+        for k, v in _members(self):
             if isinstance(v, cls):
                 yield k, v
             elif isinstance(v, Record) and v is not self:
@@ -146,7 +237,7 @@ class Record(object):
             Tuple containing the indexed attributes of this record or ``None``,
             if any index component is ``None``
         """
-        t = tuple(getattr(self, x) for x in self.index)
+        t = self._index_getter(self)
         if any(x is None for x in t):
             return None
         return t
@@ -199,7 +290,7 @@ class Record(object):
         Returns:
             Layout dictionary.
         """
-        retval = {k: f"{prefix}{k}" for k in signature(cls).parameters.keys()}
+        retval = {k: f"{prefix}{k}" for k in _parameter_names(cls)}
         if allow is not None:
             retval = {k: v for k, v in retval.items() if v in allow}
         return retval
@@ -10,7 +10,7 @@ from .person import Person, PersonProperty, Property
 from .vehicle import Vehicle, VehicleProperty
 from .mission import Mission
 from .sqlite_db import SqliteDatabase
-from .utils import Sequence, chunk, kwargs_from
+from .utils import Sequence, chunk, compile_layout
 from .table_info import SchemaIterator
 from .table_io import CsvParser
 from .record import Record
@@ -97,13 +97,13 @@ class Repository(object):
         """
         _type = self.native_types[table]
         rectype = self._db.schema[table].record_type
-        layout = _type.layout(allow=rectype._fields)
+        get_kwargs = compile_layout(_type.layout(allow=rectype._fields))
 
         for rec in self._db.select(table,
                                    where=where,
                                    order=order,
                                    **kwargs):
-            yield _type(**kwargs_from(rec, layout))
+            yield _type(**get_kwargs(rec))
 
     def read(self,
              table: str,
@@ -125,13 +125,13 @@ class Repository(object):
             Native type representation of matching records
         """
         _type = self.native_types[table]
-        layout = _type.layout()
+        get_kwargs = compile_layout(_type.layout(), None)
         for rec in self._db.join(table,
                                  where=where,
                                  order=order,
                                  depth=2,
                                  **kwargs):
-            yield _type(**kwargs_from(rec, layout, None))
+            yield _type(**get_kwargs(rec))
 
     def find(self, records: Iterable[Record]) -> Iterator[Record]:
         """Find records in the database
@@ -150,7 +150,7 @@ class Repository(object):
         _type = recs.element_type
         table = self._native_tables[_type]
         rectype = self._db.schema[table].record_type
-        layout = _type.layout(allow=rectype._fields)
+        get_kwargs = compile_layout(_type.layout(allow=rectype._fields), None)
         col_types = self._db.schema[table].column_types
         _where = " and ".join(f"{k}={self._db.var(k + '_')}"
                               for k in _type.index)
@@ -166,7 +166,7 @@ class Repository(object):
                                     where=_where,
                                     rectype=rectype,
                                     **kwargs)
-            yield _type(**kwargs_from(t, layout, None))
+            yield _type(**get_kwargs(t))
 
     def add(self,
             table: str,
@@ -193,13 +193,15 @@ class Repository(object):
         table_info = self._db.schema[table]
         rtable = table_info.get_column(column).ref_info[0]
         rtype = self.native_types[rtable]
-        layout = ptype.layout(allow=table_info.record_type._fields)
+        get_kwargs = compile_layout(
+            ptype.layout(allow=table_info.record_type._fields)
+        )
 
         for rec in recs:
             dest = {v.uid: v for k, v in rec.select(rtype) if v.uid is not None}
             where = f"{column} IN ({','.join(map(str, dest.keys()))})"
             for prec in self._db.select(table, where=where):
-                _property = ptype(**kwargs_from(prec, layout))
+                _property = ptype(**get_kwargs(prec))
                 if allow is None or allow(_property, rec):
                     _property.add_to(dest[_property.rec])
             yield rec
@@ -452,8 +454,7 @@ class Repository(object):
         nrec = 0
         nins = 0
         n = self._db.count(table)
-        for items in chunk(recs, 1024):
-            batch = list(items)
+        for batch in chunk(recs, 1024):
             # TODO records could be incomplete if uids are missing
             # -> add a method complete(db) to Record, which completes the record
             # or consider adding constraint, that records have to be complete
@@ -534,17 +535,17 @@ class Repository(object):
             raise IOError(f"in {path}: No header found\nCriteria:\n{_s}")
 
         _type = self.native_types[table]
-        layout = _type.layout(allow=rectype._fields)
+        get_kwargs = compile_layout(_type.layout(allow=rectype._fields))
 
         if parsers is not None:
             _parsers = tuple(parsers.get(col, lambda x: x)
                              for col in rectype._fields)
             for rec in generator:
                 _rec = rectype(*(p(x) for p, x in zip(_parsers, rec)))
-                yield _type(**kwargs_from(_rec, layout=layout))
+                yield _type(**get_kwargs(_rec))
         else:
             for rec in generator:
-                yield _type(**kwargs_from(rec, layout=layout))
+                yield _type(**get_kwargs(rec))
 
     @classmethod
     def new(cls, path):
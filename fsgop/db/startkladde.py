@@ -9,11 +9,16 @@ from .person import Person, PersonProperty
 from .vehicle import Vehicle, VehicleProperty
 from .mission import Mission
 
-from .utils import kwargs_from, get_value, set_value
+from .utils import (
+    compile_layout, get_value, set_value, get_key_value_pattern
+)
 
 logger = logging.getLogger(__name__)
 
 
+# email addresses are stored as key value pair in comments of the people table
+_EMAIL_PATTERN = get_key_value_pattern("email")
+
 LAUNCH_TYPE_WINCH = "winch"
 LAUNCH_TYPE_AEROTOW = "airtow"
 LAUNCH_TYPE_SELF = "self"
@@ -649,9 +654,9 @@ class Repository(object):
             fields = rectype._fields
         else:
             fields = set(rectype._fields) - set(ignore)
-        layout = _type.layout(allow=fields)
+        get_kwargs = compile_layout(_type.layout(allow=fields))
         for rec in generator:
-            yield rec, _type(**kwargs_from(rec, layout=layout))
+            yield rec, _type(**get_kwargs(rec))
 
     def persons(self) -> Iterator[Person]:
         """Get persons from database
@@ -660,7 +665,7 @@ class Repository(object):
             One :class:Person instance per person found in db
         """
         for rec, person in self.get("people", adapt_names=True):
-            email = get_value(rec.comments, "email")
+            email = get_value(rec.comments, _EMAIL_PATTERN)
             if email is not None:
                 PersonProperty(kind="email", value=email).add_to(person)
                 person.comments = set_value("email", None, person.comments)
@@ -752,7 +757,7 @@ class Repository(object):
         for rec, mission in self.get("flights",
                                      adapt_names=True,
                                      order="departure_time"):
-            mission.kind = categories[rec.type]
+            mission.category = categories[rec.type]
             launch_vehicle = self.vehicle_for_launch_method(rec.launch_uid)
             if launch_vehicle.category == Vehicle.categories["winch"]:
                 launch = self.winch_launch_for(mission, vehicle=launch_vehicle)
@@ -1,13 +1,161 @@
 from typing import Optional, Iterable, Generator, Tuple, NamedTuple, Union, Dict
-from typing import Type, List
-import re
+from typing import Type, List, Iterator, Callable
+import sys
+from keyword import iskeyword
 from collections import namedtuple
 from datetime import datetime, date
 from pathlib import Path
-from copy import deepcopy
+from copy import copy
+from bisect import insort
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat, islice
 
 from .table_io import CsvParser
 
+try:
+    import pandas
+    WITH_PANDAS_SUPPORT = True
+except ImportError:
+    WITH_PANDAS_SUPPORT = False
+
+# representation of NULL in MySQL dumps
+NULL = r"\N"
+
+# public attributes of ColumnInfo, which are passed to its constructor
+_COLUMN_FIELDS = (
+    "name",
+    "dtype",
+    "allows_null",
+    "force_null",
+    "default_value",
+    "extra",
+    "references",
+    "fmt"
+)
+
+
+@lru_cache(maxsize=256)
+def _native_type_of(dtype: str) -> Type:
+    """Get native python type for a SQL data type
+
+    Results are cached, since many columns share the same data type.
+
+    Args:
+        dtype: SQL data type, e.g. ``'int(11)'`` or ``'varchar(64)'``
+
+    Returns:
+        Native type used to represent values of type `dtype`
+    """
+    s = dtype.lower()
+    if "int" in s:
+        return int
+    if "real" in s or "floa" in s or "doub" in s:
+        return float
+    if s == "date":
+        return date
+    if s == "datetime":
+        return datetime
+    return str
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(s: str, fmt: str) -> datetime:
+    """Cached version of :meth:`datetime.strptime`
+
+    Dumps typically contain the same date strings many times.
+
+    Args:
+        s: Input string
+        fmt: Format string
+
+    Returns:
+        datetime instance
+    """
+    return datetime.strptime(s, fmt)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(s: str, fmt: str) -> date:
+    """Cached conversion of a string to a date
+
+    Args:
+        s: Input string
+        fmt: Format string
+
+    Returns:
+        date instance
+    """
+    return datetime.strptime(s, fmt).date()
+
+
+def _slots_record_type(name: str, fields: List[str]) -> type:
+    """Create a mutable record class with one slot per field
+
+    The class mimics the part of the namedtuple interface used in this
+    package (``_fields``, ``_make``, ``_asdict``, iteration and comparison),
+    but stores values in slots. The constructor is generated with one
+    positional argument per field to avoid packing and unpacking of
+    arguments.
+
+    Args:
+        name: Name of the new class
+        fields: Field names
+
+    Returns:
+        New record class
+
+    Raise:
+        ValueError: If a field name is not a valid identifier or a keyword
+    """
+    fields = tuple(fields)
+    for s in fields:
+        if not s.isidentifier() or iskeyword(s) or s.startswith("_"):
+            raise ValueError(f"Invalid field name: '{s}'")
+    args = ", ".join(fields)
+    body = "".join(f"\n    self.{s} = {s}" for s in fields) or "\n    pass"
+    values = "".join(f"self.{s}, " for s in fields)
+    namespace = dict()
+    exec(f"def __init__(self, {args}):{body}\n"
+         f"def _values(self):\n    return ({values})\n",
+         namespace)
+    _values = namespace["_values"]
+
+    def _make(cls, iterable):
+        return cls(*iterable)
+
+    def _asdict(self):
+        return dict(zip(self._fields, _values(self)))
+
+    def __iter__(self):
+        return iter(_values(self))
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return _values(self) == _values(other)
+
+    def __repr__(self):
+        items = ", ".join(f"{k}={v!r}" for k, v in zip(self._fields,
+                                                       _values(self)))
+        return f"{type(self).__name__}({items})"
+
+    return type(name, (object,), {
+        "__slots__": fields,
+        "_fields": fields,
+        "__init__": namespace["__init__"],
+        "_make": classmethod(_make),
+        "_asdict": _asdict,
+        "__iter__": __iter__,
+        "__len__": __len__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__repr__": __repr__
+    })
+
 
 class ColumnInfo(object):
     """Stores metadata for a column of a (MySQL) Table
@@ -24,7 +172,16 @@ class ColumnInfo(object):
             referenced in this column, e.g. "Person(uid)"
         fmt: Format string for this column. Used by parser in some cases.
     """
-    references_pattern = re.compile(r"(\w+)\s*\((\w+)\)")
+    __slots__ = _COLUMN_FIELDS + (
+        "_parser",
+        "_native_type",
+        "_default_sql",
+        "_default_source",
+        "_has_auto_increment",
+        "_extra_source",
+        "_ref_info",
+        "_ref_source"
+    )
     default_date_format = "%Y-%m-%d"
     default_time_format = "%H:%M:%S"
     default_datetime_format = "%Y-%m-%d %H:%M:%S"
@@ -38,13 +195,17 @@ class ColumnInfo(object):
                  extra: str = "",
                  references: Optional[str] = None,
                  fmt: Optional[str] = None) -> None:
-        self.name = name
-        self.dtype = dtype
+        # names are hashed for every record -> intern them
+        self.name = sys.intern(name) if isinstance(name, str) else name
+        self.dtype = sys.intern(dtype) if isinstance(dtype, str) else dtype
         self.allows_null = allows_null
         self.force_null = force_null
         self.default_value = default_value
-        self.extra = extra
+        self.extra = sys.intern(extra) if isinstance(extra, str) else extra
         self.references = references
+        self._ref_source = None
+        self._ref_info = (None, None)
+        self.ref_info  # validate references early
         self.fmt = str(fmt) if fmt is not None else None
         self._parser = None
         self._native_type = None
@@ -52,7 +213,11 @@ class ColumnInfo(object):
 
         if self.default_value is not None:
             if type(self.default_value) != self.native_type:
-                self.default_value = self._parser(self.default().strip("'"))
+                self.default_value = self._parser(
+                    str(self.default_value).strip("'"))
+        self._default_source = self._default_sql = None
+        self._has_auto_increment = None
+        self._extra_source = None
 
     @property
     def ref_info(self) -> tuple:
@@ -62,12 +227,21 @@ class ColumnInfo(object):
             Table name and column name referenced by this column, tuple of two
             ``None`` instances, if nothing is referenced.
         """
-        if self.references:
-            m = self.references_pattern.match(self.references)
-            if m:
-                return m.group(1), m.group(2)
-            raise ValueError(f"Invalid reference string: '{self.references}'")
-        return None, None
+        if self._ref_source is not self.references:
+            # references has been modified since last call -> parse again
+            if self.references:
+                table, sep, column = self.references.partition("(")
+                table = table.strip()
+                column, sep2, _ = column.partition(")")
+                column = column.strip()
+                if not (sep2 and table.isidentifier() and column.isidentifier()):
+                    raise ValueError(
+                        f"Invalid reference string: '{self.references}'")
+                self._ref_info = (sys.intern(table), sys.intern(column))
+            else:
+                self._ref_info = (None, None)
+            self._ref_source = self.references
+        return self._ref_info
 
     @property
     def native_type(self) -> Type:
@@ -93,7 +267,13 @@ class ColumnInfo(object):
             ``True`` if and only if the current column is incremented
             automatically
         """
-        return "auto_increment" in self.extra
+        if self._has_auto_increment is None or (self._extra_source
+                                                is not self.extra):
+            # extra has been modified since last call
+            self._has_auto_increment = ("auto_increment"
+                                        in (self.extra or "").lower())
+            self._extra_source = self.extra
+        return self._has_auto_increment
 
     def default(self) -> str:
         """Default value as escaped string required in MySQL statements
@@ -101,9 +281,13 @@ class ColumnInfo(object):
         Returns:
             '<val>' or NULL
         """
-        if self.default_value is None:
-            return "NULL"
-        return f"'{self.default_value}'"
+        if self._default_sql is None or (self._default_source
+                                         is not self.default_value):
+            # default value has been modified since last call
+            self._default_sql = ("NULL" if self.default_value is None
+                                 else f"'{self.default_value}'")
+            self._default_source = self.default_value
+        return self._default_sql
 
     def sql_references(self) -> str:
         """Get SQL reference statement for this column
@@ -115,10 +299,6 @@ class ColumnInfo(object):
             return f" REFERENCES {self.references}"
         return ""
 
-    @staticmethod
-    def _force_none(f):
-        return lambda x: f(x) or None
-
     @staticmethod
     def _int_parser(s: str) -> Optional[int]:
         """Default parser for integer values
@@ -129,10 +309,24 @@ class ColumnInfo(object):
         Returns:
             Integer
         """
-        if s is None or s == r"\N":
+        if s is None or s == NULL:
             return None
         return int(s)
 
+    @staticmethod
+    def _int_parser_force_null(s: str) -> Optional[int]:
+        """Parser for integer values converting zero to ``None``
+
+        Args:
+            s: Input string
+
+        Returns:
+            Integer or ``None``
+        """
+        if s is None or s == NULL:
+            return None
+        return int(s) or None
+
     @staticmethod
     def _float_parser(s: str) -> Optional[float]:
         """Default parser for float values
@@ -143,10 +337,24 @@ class ColumnInfo(object):
         Returns:
             float
         """
-        if s is None or s == r"\N":
+        if s is None or s == NULL:
             return None
         return float(s)
 
+    @staticmethod
+    def _float_parser_force_null(s: str) -> Optional[float]:
+        """Parser for float values converting zero to ``None``
+
+        Args:
+            s: Input string
+
+        Returns:
+            float or ``None``
+        """
+        if s is None or s == NULL:
+            return None
+        return float(s) or None
+
     @staticmethod
     def _str_parser(s: str) -> Optional[str]:
         """Default parser for datetime strings
@@ -157,10 +365,24 @@ class ColumnInfo(object):
         Returns:
             string version of s
         """
-        if s is None or s == r"\N":
+        if s is None or s == NULL:
             return None
         return str(s)
 
+    @staticmethod
+    def _str_parser_force_null(s: str) -> Optional[str]:
+        """Parser for strings converting the empty string to ``None``
+
+        Args:
+            s: Input string
+
+        Returns:
+            string version of s or ``None``
+        """
+        if s is None or s == NULL:
+            return None
+        return str(s) or None
+
     def _date_parser(self, s: str) -> Optional[date]:
         """Default parser for date strings
 
@@ -170,9 +392,9 @@ class ColumnInfo(object):
         Returns:
             date instance
         """
-        if s is None or s == r"\N":
+        if s is None or s == NULL:
             return None
-        return datetime.strptime(s, self.fmt).date()
+        return _parse_date(s, self.fmt)
 
     def _datetime_parser(self, s: str) -> Optional[date]:
         """Default parser for date strings
@@ -183,41 +405,39 @@ class ColumnInfo(object):
         Returns:
             date instance
         """
-        if s is None or s == r"\N":
+        if s is None or s == NULL:
             return None
-        return datetime.strptime(s, self.fmt)
+        return _parse_datetime(s, self.fmt)
 
     def _set_parser(self):
         """Set parser for this column
         """
         if self.dtype is None:
             return
-        s = self.dtype.lower()
-        if "int" in s:
-            self._native_type = int
-            self._parser = self._int_parser
+        # date and datetime instances always evaluate as True -> force_null
+        # only requires dedicated parsers for the remaining types
+        force_null = self.allows_null and self.force_null
+        self._native_type = _native_type_of(self.dtype)
+        if self._native_type is int:
+            self._parser = (self._int_parser_force_null if force_null
+                            else self._int_parser)
             # 'int' is not sufficient to create integer primary keys in sqlite:
             #  https://www.sqlite.org/lang_createtable.html#rowid
             self.dtype = "integer"
-        elif "real" in s or "floa" in s or "doub" in s:
-            self._native_type = float
-            self._parser = self._float_parser
-        elif s == "date":
-            self._native_type = date
+        elif self._native_type is float:
+            self._parser = (self._float_parser_force_null if force_null
+                            else self._float_parser)
+        elif self._native_type is date:
             self._parser = self._date_parser
             if self.fmt is None:
                 self.fmt = self.default_date_format
-        elif s == "datetime":
-            self._native_type = datetime
+        elif self._native_type is datetime:
             self._parser = self._datetime_parser
             if self.fmt is None:
                 self.fmt = self.default_datetime_format
         else:
-            self._native_type = str
-            self._parser = self._str_parser
-
-        if self.allows_null and self.force_null:
-            self._parser = self._force_none(self._parser)
+            self._parser = (self._str_parser_force_null if force_null
+                            else self._str_parser)
 
 
 class IndexInfo(object):
@@ -229,37 +449,62 @@ class IndexInfo(object):
         is_primary: ``True`` if and only if this is the primary index.
         columns: List of tuples, where each tuple contains the arguments to
             :meth:`IndexInfo.add_column` for the column to add to this index.
+
+    `name` and `is_primary` determine the order and the hash of an index and
+    are therefore read-only.
     """
+    __slots__ = (
+        "_name",
+        "is_unique",
+        "_is_primary",
+        "_cols",
+        "_n_missing",
+        "_key_format",
+        "_sort_key",
+        "_hash"
+    )
+
     def __init__(self,
                  name: str,
                  is_unique: bool = False,
                  is_primary: bool = False,
                  columns: Optional[Iterable[tuple]] = None) -> None:
-        self.name = name
+        self._name = sys.intern(name) if isinstance(name, str) else name
         self.is_unique = bool(is_unique)
-        self.is_primary = bool(is_primary)
+        self._is_primary = bool(is_primary)
+        self._sort_key = (not self._is_primary, self._name)
+        self._hash = hash(self._sort_key)
         self._cols = []
+        self._n_missing = 0  # number of None placeholders in self._cols
+        self._key_format = None
 
         if columns is not None:
-            for col in columns:
+            _columns = list(columns)
+            if all(len(c) > 2 and c[2] is not None for c in _columns):
+                # all positions are known -> allocate list only once
+                self._cols = len(_columns) * [None]
+                self._n_missing = len(_columns)
+            for col in _columns:
                 self.add_column(*col)
-            if None in self._cols:
+            if self._n_missing:
                 raise ValueError(f"Index '{self.name}' incomplete: Missing "
-                                 f"information about {self._cols.count(None)} / "
+                                 f"information about {self._n_missing} / "
                                  f"{len(self._cols)} indexed columns")
 
     def __lt__(self, other: "IndexInfo") -> bool:
         """Less comparison by is_primary and name"""
-        return (not self.is_primary, self.name) < (not other.is_primary,
-                                                   other.name)
+        return self._sort_key < other._sort_key
 
     def __gt__(self, other: "IndexInfo") -> bool:
         """Greater comparison by is_primary and name"""
-        return (not self.is_primary, self.name) > (not other.is_primary,
-                                                   other.name)
+        return self._sort_key > other._sort_key
 
     def __ge__(self, other: "IndexInfo") -> bool:
-        return not (self < other)
+        return not (self._sort_key < other._sort_key)
+
+    def __hash__(self) -> int:
+        """Hash by is_primary and name"""
+        return self._hash
 
     def __eq__(self, other: "IndexInfo") -> bool:
         return (self.name == other.name
@@ -267,6 +512,16 @@ class IndexInfo(object):
                 and self.is_primary == other.is_primary
                 and self._cols == other._cols)
 
+    @property
+    def name(self) -> str:
+        """Get name of this index"""
+        return self._name
+
+    @property
+    def is_primary(self) -> bool:
+        """Return True if and only if this is the primary index"""
+        return self._is_primary
+
     @property
     def is_id(self) -> bool:
         """Return True if and only if this index is the unique ID index"""
@@ -290,17 +545,30 @@ class IndexInfo(object):
             sequence: Zero based index of the column within the index. Defaults
                 to the current number of columns.
         """
-        i = int(sequence) if sequence is not None else len(self._cols)
-        n_missing = i + 1 - len(self._cols)
-        if n_missing > 0:
-            self._cols.extend(n_missing * [None])
         _order = int(order)
         assert _order in (-1, 0, 1)
-        self._cols[i] = (str(name), int(order))
+        self._key_format = None
+        n = len(self._cols)
+        i = int(sequence) if sequence is not None else n
+        if i == n:
+            # common case: columns are added in order -> append
+            self._cols.append((sys.intern(str(name)), _order))
+            return
+
+        if i > n:
+            n_missing = i + 1 - n
+            self._cols.extend(repeat(None, n_missing))
+            self._n_missing += n_missing
+        if self._cols[i] is None:
+            self._n_missing -= 1
+        self._cols[i] = (sys.intern(str(name)), _order)
 
     def key_format(self) -> str:
         """Get SQL KEY as string"""
-        return ",".join(f"{n}{' DESC' if i < 0 else ''}" for n, i in self._cols)
+        if self._key_format is None:
+            self._key_format = ",".join(n + ("", " DESC")[i < 0]
+                                        for n, i in self._cols)
+        return self._key_format
 
     def as_dict(self) -> dict:
         """Convert content to a dictionary"""
@@ -326,11 +594,21 @@ class TableInfo(object):
                  name: Optional[str] = None,
                  columns: Optional[Iterable[ColumnInfo]] = None,
                  indices: Optional[Iterable[IndexInfo]] = None) -> None:
-        self.name = name
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self._cols = []
-        self._indices = dict()
+        self._col_index = dict()  # column name -> position in self._cols
+        self._indices = None  # created on demand by add_index
+        self._sorted_indices = None  # indices in ascending order
+        self._primary = None  # first primary index
+        self._index_names = None
+        self._finalized = False
         self._record_type = None
-        
+        self._record_types = dict()  # (name, aliases, backend) -> record type
+        self._formats = dict()  # placeholder -> format string
+        self._parsers = None
+        self._columns = None
+        self._column_types = None
+
         if columns is not None:
             for col in columns:
                 self.add_column(col)
@@ -339,18 +617,48 @@ class TableInfo(object):
             for idx in indices:
                 self.add_index(idx)
 
-    def __iter__(self) -> Generator[ColumnInfo, None, None]:
+    def __iter__(self) -> Iterator[ColumnInfo]:
         """Iterate over the columns of this table
 
-        Yields:
-            Column information
+        Returns:
+            Iterator over the column information
         """
-        yield from self._cols
+        return iter(self._cols)
 
     def __eq__(self, other: "TableInfo") -> bool:
         return (self.name == other.name
-                and self._cols == other._cols
-                and self._indices == other._indices)
+                and tuple(self._cols) == tuple(other._cols)
+                and (self._indices or {}) == (other._indices or {}))
+
+    def __getstate__(self) -> dict:
+        """Get state for pickling without cached record types
+
+        Returns:
+            Copy of the instance dictionary with all caches reset
+        """
+        state = self.__dict__.copy()
+        state["_record_type"] = None
+        state["_record_types"] = dict()
+        state["_parsers"] = None
+        state["_column_types"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore pickled state and invalidate the column index
+
+        Args:
+            state: Instance dictionary of the pickled object
+        """
+        self.__dict__.update(state)
+        self._col_index = None
+        self._record_types = dict()
+        self._formats = dict()
+        self._parsers = None
+        self._columns = None
+        self._column_types = None
+        self.__dict__.setdefault("_finalized", False)
+        if self._finalized:
+            self._columns = tuple(c.name for c in self._cols)
 
     @property
     def ncols(self) -> int:
@@ -364,7 +672,7 @@ class TableInfo(object):
     @property
     def nidx(self) -> int:
         """Get number of indices for this table"""
-        return len(self._indices)
+        return len(self._indices) if self._indices is not None else 0
 
     @property
     def columns(self) -> Tuple[Optional[str]]:
@@ -373,11 +681,51 @@ class TableInfo(object):
         Returns:
             Name of each column in this table
         """
+        if self._columns is not None:
+            return self._columns
         return tuple(c.name for c in self._cols)
 
     @property
-    def index_names(self) -> set:
-        return set(self._indices.keys())
+    def dtypes(self) -> Tuple[Optional[str]]:
+        """Get data types of all columns in this table
+
+        Returns:
+            Data type of each column in this table
+        """
+        return tuple(c.dtype for c in self._cols)
+
+    @property
+    def defaults(self) -> Tuple[str]:
+        """Get SQL default values of all columns in this table
+
+        Returns:
+            Escaped default value of each column in this table as returned by
+            :meth:`ColumnInfo.default`
+        """
+        return tuple(c.default() for c in self._cols)
+
+    @property
+    def parsers(self) -> tuple:
+        """Get parser of each column
+
+        Returns:
+            Tuple containing one callable per column, which converts a string
+            to the native type of the column.
+        """
+        if self._parsers is None:
+            self._parsers = tuple(c._parser for c in self._cols)
+        return self._parsers
+
+    @property
+    def index_names(self) -> frozenset:
+        """Get names of all indices of this table
+
+        Returns:
+            Immutable set containing the name of each index
+        """
+        if self._index_names is None:
+            self._index_names = frozenset(self._indices or ())
+        return self._index_names
 
     @property
     def record_type(self) -> Type[NamedTuple]:
@@ -398,7 +746,10 @@ class TableInfo(object):
         Returns:
             named tuple containing the type for each column
         """
-        return self.record_type(*(c.native_type for c in self._cols))
+        if self._column_types is None:
+            self._column_types = self.record_type(*(c.native_type
+                                                    for c in self._cols))
+        return self._column_types
 
     def get_references(self) -> dict:
         """Get information about references in this table
@@ -409,37 +760,70 @@ class TableInfo(object):
             are referenced by this table.
         """
         retval = dict()
-        for col in self._cols:
-            table, column = col.ref_info
-            if table:
-                retval.setdefault(table, set()).add(column)
+        for _, table, column in self.reference_list():
+            retval.setdefault(table, set()).add(column)
         return retval
 
-    def indices(self) -> Generator[IndexInfo, None, None]:
+    def reference_list(self) -> List[Tuple[str, str, str]]:
+        """Get all columns of this table referencing another table
+
+        Returns:
+            List of tuples containing name of the referencing column, name of
+            the referenced table and name of the referenced column
+        """
+        return [(col.name,) + col.ref_info
+                for col in self._cols if col.references]
+
+    def indices(self) -> Iterator[Tuple[str, IndexInfo]]:
         """Iterate over all indices of this table
 
-        Yields:
-            tuple(str, :class:`IndexInfo`): index name and :class:`IndexInfo`
-               object for each index
+        Returns:
+            Iterator over tuples containing index name and :class:`IndexInfo`
+            object for each index
         """
-        yield from self._indices.items()
+        if self._indices is None:
+            return iter(())
+        return iter(self._indices.items())
 
     def add_column(self, col: ColumnInfo) -> None:
         """Insert a column into the table
         
         Args:
             col: Column information to insert
+
+        Raise:
+            RuntimeError: If the table has been finalized
         """
+        self._check_not_finalized()
+        if self._col_index is not None:
+            self._col_index.setdefault(col.name, len(self._cols))
         self._cols.append(col)
-        self._record_type = None
+        self._clear_caches()
 
     def add_index(self, idx: IndexInfo) -> None:
         """Add an index for this table
 
         Args:
             idx: Index information to insert
+
+        Raise:
+            RuntimeError: If the table has been finalized
         """
+        self._check_not_finalized()
+        if self._indices is None:
+            self._indices = dict()
+            self._sorted_indices = []
+        # name and is_primary of an IndexInfo are read-only, so the sorted
+        # list and the primary index only change here
+        old = self._indices.get(idx.name)
+        if old is not None:
+            self._sorted_indices.remove(old)
+        insort(self._sorted_indices, idx)
         self._indices[idx.name] = idx
+        self._index_names = None
+        if idx.is_primary or (old is not None and old is self._primary):
+            self._primary = next(
+                (i for i in self._indices.values() if i.is_primary), None)
 
     def format(self, placeholder: str = "%s") -> str:
         """Returns a tuple to be passed to INSERT INTO VALUES command.
@@ -450,7 +834,13 @@ class TableInfo(object):
         Returns:
             format string
         """
-        return f"({','.join(self.ncols * [placeholder])})"
+        retval = self._formats.get(placeholder)
+        if retval is None:
+            n = self.ncols
+            tail = (n - 1) * f",{placeholder}"
+            retval = f"({placeholder}{tail})" if n else "()"
+            self._formats[placeholder] = retval
+        return retval
 
     def primary_key(self) -> str:
         """Get primary key statement
@@ -459,10 +849,9 @@ class TableInfo(object):
             Format string for the first key marked as primary, empty string
             if no primary key is defined
         """
-        for name, idx in self.indices():
-            if idx.is_primary:
-                return f"PRIMARY KEY ({idx.key_format()})"
-        return ""
+        if self._primary is None:
+            return ""
+        return f"PRIMARY KEY ({self._primary.key_format()})"
 
     @property
     def id_column(self) -> Optional[str]:
@@ -488,10 +877,7 @@ class TableInfo(object):
         Raise:
             KeyError: If no column with the given `name` exists.
         """
-        for col in self._cols:
-            if col.name == name:
-                return col
-        raise KeyError(f"No such column: '{name}'")
+        return self._cols[self._position(name)]
 
     def pop_column(self, name: str) -> ColumnInfo:
         """Remove column with a given name
@@ -504,15 +890,91 @@ class TableInfo(object):
 
         Raise:
             KeyError: If no column with the given `name` exists.
+            RuntimeError: If the table has been finalized
+        """
+        self._check_not_finalized()
+        col = self._cols.pop(self._position(name))
+        self._col_index = None  # positions of subsequent columns changed
+        self._clear_caches()
+        return col
+
+    def finalize(self) -> None:
+        """Mark the columns and indices of this table as final
+
+        Converts the internal column sequences to tuples and fills all caches
+        derived from them. Afterwards :attr:`columns` is returned without
+        copying and no columns or indices may be added or removed. Columns
+        must not be renamed after this call.
         """
+        if self._finalized:
+            return
+        self._cols = tuple(self._cols)
+        self._columns = tuple(c.name for c in self._cols)
+        if self._col_index is None:
+            self._rebuild_index()
+        self.parsers  # fill cache
+        self._finalized = True
+
+    def _check_not_finalized(self) -> None:
+        """Raise if the table has been finalized
+
+        Raise:
+            RuntimeError: If :meth:`finalize` has been called for this table
+        """
+        if self._finalized:
+            raise RuntimeError(f"Table '{self.name}' is finalized")
+
+    def _clear_caches(self) -> None:
+        """Discard all cached data derived from the columns of this table"""
+        self._record_type = None
+        self._record_types.clear()
+        self._formats.clear()
+        self._parsers = None
+        self._columns = None
+        self._column_types = None
+
+    def _position(self, name: str) -> int:
+        """Get position of the column with a given name
+
+        The column index is only updated when columns are added or removed.
+        If a column has been renamed since, the index is rebuilt before the
+        lookup is given up.
+
+        Args:
+            name: Column name
+
+        Returns:
+            Position of the first column with the given `name`
+
+        Raise:
+            KeyError: If no column with the given `name` exists.
+        """
+        idx = self._col_index
+        if idx is not None:
+            i = idx.get(name)
+            if i is not None and self._cols[i].name == name:
+                return i
+        i = self._rebuild_index().get(name)
+        if i is None:
+            raise KeyError(f"No such column: '{name}'")
+        return i
+
+    def _rebuild_index(self) -> Dict[str, int]:
+        """Rebuild the mapping of column names to column positions
+
+        Returns:
+            Dictionary containing the position of each column name in this
+            table. If a name occurs more than once, the first position is used.
+        """
+        self._col_index = dict()
         for i, col in enumerate(self._cols):
-            if col.name == name:
-                return self._cols.pop(i)
-        raise KeyError(f"No such column: '{name}'")
+            self._col_index.setdefault(col.name, i)
+        return self._col_index
 
     def create_record_type(self,
                            name: Optional[str] = None,
-                           aliases: Optional[dict] = None) -> Type[namedtuple]:
+                           aliases: Optional[dict] = None,
+                           backend: str = "namedtuple") -> Type[namedtuple]:
         """Reset the internal record type to a named tuple for this table
 
         Args:
@@ -520,16 +982,35 @@ class TableInfo(object):
                 ``'<name>Record'`` where <name> is the table name.
             aliases: Dictionary containing an alias as value for each column name
                (key) in this table. Column names not in aliases are not modified.
+            backend: Either ``'namedtuple'`` (default) or ``'slots'``. The
+                latter creates a mutable class with ``__slots__``, which is
+                cheaper to construct during bulk imports.
 
         Returns:
-            named tuple type for records of this table
+            named tuple type for records of this table. Types are cached, i.e.
+            identical arguments yield the identical type until the columns of
+            this table are modified.
+
+        Raise:
+            ValueError: If backend is unknown
         """
         _alias = aliases if aliases is not None else dict()
         if name is not None:
             _n = name
         else:
             _n = f"{''.join(s.capitalize() for s in self.name.split('_'))}Record"
-        return namedtuple(_n, [_alias.get(k, k) for k in self.columns])
+        key = (_n, tuple(sorted(_alias.items())), backend)
+        retval = self._record_types.get(key)
+        if retval is None:
+            fields = [_alias.get(k, k) for k in self.columns]
+            if backend == "namedtuple":
+                retval = namedtuple(_n, fields)
+            elif backend == "slots":
+                retval = _slots_record_type(_n, fields)
+            else:
+                raise ValueError(f"Unknown record backend: '{backend}'")
+            self._record_types[key] = retval
+        return retval
 
     def reset_record_type(self,
                           name: Optional[str] = None,
@@ -543,6 +1024,21 @@ class TableInfo(object):
                (key) in this table. Column names not in aliases are not modified.
         """
         self._record_type = self.create_record_type(name, aliases)
+        self._column_types = None
+
+    def copy(self) -> "TableInfo":
+        """Create a copy of this table
+
+        Columns and indices are copied, so that the copy can be modified
+        without affecting this table. Cached data is not copied.
+
+        Returns:
+            New TableInfo object, which is not finalized
+        """
+        return TableInfo(name=self.name,
+                         columns=[copy(col) for col in self._cols],
+                         indices=[IndexInfo(**idx.as_dict())
+                                  for _, idx in self.indices()])
 
     def as_dict(self) -> dict:
         """Convert table information into a dictionary
@@ -553,10 +1049,10 @@ class TableInfo(object):
         """
         return {
             "columns": [
-                {k: v for k, v in vars(col).items() if not k.startswith("_")}
+                {k: getattr(col, k) for k in _COLUMN_FIELDS}
                 for col in self._cols
             ],
-            "indices": [i.as_dict() for i in sorted(self._indices.values())]
+            "indices": [i.as_dict() for i in self._sorted_indices or ()]
         }
 
     @classmethod
@@ -588,9 +1084,10 @@ class TableInfo(object):
     def read_mysql_dump(self,
                         path: Union[str, Path],
                         reader: Optional[CsvParser] = None,
-                        aliases: Optional[dict] = None) -> Generator[NamedTuple,
-                                                                     None,
-                                                                     None]:
+                        aliases: Optional[dict] = None,
+                        backend: str = "namedtuple") -> Generator[NamedTuple,
+                                                                  None,
+                                                                  None]:
         """Iterate over records of a MySql dump of this table
 
         Args:
@@ -600,17 +1097,207 @@ class TableInfo(object):
             aliases: Dictionary containing a column name and an alias for
                 selected columns. The resulting namedtuple will use the aliases
                 as column names. Names not found in aliases remain unchanged.
+            backend: Record type backend. See :meth:`create_record_type`.
 
         Yields:
             One namedtuple per record of the input file
         """
         if reader is None:
             reader = CsvParser()
+        # the parser is used as row type, so that the reader creates each
+        # record directly from the row of strings
+        parse = self.row_parser(self.create_record_type(aliases=aliases,
+                                                        backend=backend),
+                                unpack=True)
+        yield from reader(str(path),
+                          skip_rows=0,
+                          row_type=parse,
+                          delimiter="\t")
+
+    def read_mysql_dump_chunks(self,
+                               path: Union[str, Path],
+                               chunk_size: int = 10000,
+                               reader: Optional[CsvParser] = None,
+                               aliases: Optional[dict] = None,
+                               backend: str = "namedtuple"
+                               ) -> Generator[List[NamedTuple], None, None]:
+        """Iterate over chunks of records of a MySql dump of this table
+
+        Same as :meth:`read_mysql_dump`, but records are returned in lists of
+        up to `chunk_size` elements, which can be passed directly to bulk
+        operations like ``executemany``.
+
+        Args:
+            path: Path to input file
+            chunk_size: Maximum number of records per chunk
+            reader: CSV file parser. If ``None``, a new default reader will be
+                constructed.
+            aliases: Dictionary containing a column name and an alias for
+                selected columns. The resulting namedtuple will use the aliases
+                as column names. Names not found in aliases remain unchanged.
+            backend: Record type backend. See :meth:`create_record_type`.
+
+        Yields:
+            List of namedtuples containing the next records of the input file
+
+        Raise:
+            ValueError: If chunk_size is not positive
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+        records = self.read_mysql_dump(path,
+                                       reader=reader,
+                                       aliases=aliases,
+                                       backend=backend)
+        chunk = list(islice(records, chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(records, chunk_size))
+
+    def read_mysql_dump_parallel(self,
+                                 paths: Iterable[Union[str, Path]],
+                                 executor: Optional[Executor] = None,
+                                 aliases: Optional[dict] = None,
+                                 backend: str = "namedtuple"
+                                 ) -> Generator[NamedTuple, None, None]:
+        """Iterate over records of several MySql dumps of this table
+
+        Each file is parsed by a separate task of `executor`, such that
+        multiple files are parsed concurrently. Records are yielded in the
+        order of `paths`.
+
+        Args:
+            paths: Paths to input files
+            executor: Executor used to parse the files. If ``None``, a
+                :class:`concurrent.futures.ProcessPoolExecutor` with default
+                arguments is created and shut down after the last record.
+            aliases: Dictionary containing a column name and an alias for
+                selected columns. The resulting namedtuple will use the aliases
+                as column names. Names not found in aliases remain unchanged.
+            backend: Record type backend. See :meth:`create_record_type`.
+
+        Yields:
+            One namedtuple per record of the input files
+        """
+        _rec = self.create_record_type(aliases=aliases, backend=backend)
+        pool = ProcessPoolExecutor() if executor is None else executor
+        try:
+            # record types are created dynamically and cannot be pickled ->
+            # workers return plain tuples
+            futures = [pool.submit(_read_mysql_dump_rows, self, str(path))
+                       for path in paths]
+            for future in futures:
+                yield from map(_rec._make, future.result())
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+    def read_mysql_dump_bulk(self,
+                             path: Union[str, Path],
+                             aliases: Optional[dict] = None
+                             ) -> Iterator[NamedTuple]:
+        """Read all records of a MySql dump of this table at once
+
+        Same as :meth:`read_mysql_dump`, but the file is tokenized by
+        :func:`pandas.read_csv` and each column is converted as a whole. This
+        is considerably faster for large dumps, but requires pandas and reads
+        the entire file into memory.
+
+        Args:
+            path: Path to input file
+            aliases: Dictionary containing a column name and an alias for
+                selected columns. The resulting namedtuple will use the aliases
+                as column names. Names not found in aliases remain unchanged.
+
+        Returns:
+            Iterator yielding one namedtuple per record of the input file
+
+        Raise:
+            RuntimeError: If pandas is not installed
+        """
+        if not WITH_PANDAS_SUPPORT:
+            raise RuntimeError("Missing package: pandas")
         _rec = self.create_record_type(aliases=aliases)
-        parsers = tuple(col._parser for col in self._cols)
+        df = pandas.read_csv(str(path),
+                             sep="\t",
+                             header=None,
+                             names=self.columns,
+                             dtype=str,
+                             na_values=[NULL],
+                             keep_default_na=False)
+        columns = []
+        for col in self._cols:
+            s = df[col.name]
+            if col.native_type is int:
+                s = pandas.to_numeric(s).astype("Int64")
+            elif col.native_type is float:
+                s = pandas.to_numeric(s)
+            elif col.native_type is datetime:
+                s = pandas.to_datetime(s, format=col.fmt)
+            elif col.native_type is date:
+                s = pandas.to_datetime(s, format=col.fmt).dt.date
+            values = s.astype(object).where(s.notna(), None).tolist()
+            if col.native_type is datetime:
+                # database drivers like sqlite3 do not accept pandas.Timestamp
+                values = [x if x is None else x.to_pydatetime()
+                          for x in values]
+            if col.allows_null and col.force_null:
+                values = [x or None for x in values]
+            columns.append(values)
+        return map(_rec._make, zip(*columns))
+
+    def row_parser(self,
+                   rectype: Type[NamedTuple],
+                   unpack: bool = False) -> Callable:
+        """Create a function converting a row of strings into a record
+
+        The function body is generated for the number of columns in this table,
+        such that each column parser is called directly without iterating over
+        the parsers for every row.
+
+        Args:
+            rectype: Type of the returned records. Must accept one positional
+                argument per column.
+            unpack: If ``True``, the function accepts one positional argument
+                per column instead of a single sequence. Such a function can be
+                passed as row type to :class:`~fsgop.db.table_io.CsvParser`.
+                Defaults to ``False``.
 
-        for rec in reader(str(path), skip_rows=0, delimiter="\t"):
-            yield _rec(*(p(x) for p, x in zip(parsers, rec)))
+        Returns:
+            Function accepting a sequence of strings with one element per
+            column, or the strings as separate arguments if `unpack` is
+            ``True``, and returning an instance of `rectype`.
+        """
+        names = [f"p{i}" for i in range(self.ncols)]
+        namespace = dict(zip(names, self.parsers), _rec=rectype)
+        args = "".join(f", {s}={s}" for s in names)
+        values = ", ".join(f"{s}(r[{i}])" for i, s in enumerate(names))
+        r = "*r" if unpack else "r"
+        exec(f"def parse({r}, _rec=_rec{args}):\n    return _rec({values})\n",
+             namespace)
+        return namespace["parse"]
+
+
+def _read_mysql_dump_rows(table: TableInfo, path: str) -> List[tuple]:
+    """Parse all rows of a MySql dump into plain tuples
+
+    Helper for :meth:`TableInfo.read_mysql_dump_parallel`, which is executed in
+    worker processes.
+
+    Args:
+        table: Table information
+        path: Path to input file
+
+    Returns:
+        List containing a tuple of native values for each row
+    """
+    parse = table.row_parser(_tuple, unpack=True)
+    return list(CsvParser()(path, skip_rows=0, row_type=parse, delimiter="\t"))
+
+
+def _tuple(*args) -> tuple:
+    """Picklable record type returning its arguments as tuple"""
+    return args
 
 
 def sort_tables(tables: Iterable[TableInfo]) -> List[TableInfo]:
@@ -626,18 +1313,29 @@ def sort_tables(tables: Iterable[TableInfo]) -> List[TableInfo]:
         list: Sorted list of tables
     """
     _tables = {table.name: table for table in tables}
-    _unsorted = set(_tables.keys())
+    deps = {k: set(t.get_references().keys()) for k, t in _tables.items()}
+    referenced_by = dict()
+    for k, refs in deps.items():
+        for ref in refs:
+            referenced_by.setdefault(ref, []).append(k)
+
+    # tables are sorted in levels: each level contains all tables whose
+    # references are satisfied by the previous levels.
+    level = sorted(k for k, refs in deps.items() if not refs)
     _sorted = []
-
-    while _unsorted:
-        tmp = [k for k in _unsorted
-               if all(t in _sorted for t in _tables[k].get_references().keys())]
-        if not tmp:
-            raise ValueError("Dependency loop detected")
-        for name in sorted(tmp):
-            _sorted.append(name)
-            _unsorted.remove(name)
-
+    while level:
+        _sorted.extend(level)
+        tmp = []
+        for name in level:
+            for k in referenced_by.get(name, ()):
+                refs = deps[k]
+                refs.discard(name)
+                if not refs:
+                    tmp.append(k)
+        level = sorted(tmp)
+
+    if len(_sorted) < len(_tables):
+        raise ValueError("Dependency loop detected")
     return [_tables[k] for k in _sorted]
 
 
@@ -660,10 +1358,9 @@ def dependencies(schema: dict, table: str) -> Generator[tuple, None, None]:
     if table not in schema.keys():
         raise ValueError(f"No such table in schema: '{table}'")
     for table_name, table_info in schema.items():
-        for col in table_info:
-            _table, _col = col.ref_info
+        for col_name, _table, _col in table_info.reference_list():
             if _table == table:
-                yield _col, table_name, col.name
+                yield _col, table_name, col_name
 
 
 def to_schema(d: Dict[str, Union[TableInfo, dict]]) -> Dict[str, TableInfo]:
@@ -678,11 +1375,12 @@ def to_schema(d: Dict[str, Union[TableInfo, dict]]) -> Dict[str, TableInfo]:
             be converted to TableInfo objects using TableInfo.from_list.
 
     Returns:
-        Valid schema constructed from input dictionary
+        Valid schema constructed from input dictionary. TableInfo objects
+        contained in the input are copied using :meth:`TableInfo.copy`.
     """
-    _dict = deepcopy(d)
-    return {k: v if isinstance(v, TableInfo) else TableInfo.from_list(k, **v)
-            for k, v in _dict.items()}
+    return {k: v.copy() if isinstance(v, TableInfo)
+            else TableInfo.from_list(k, **v)
+            for k, v in d.items()}
 
 
 class SchemaIterator(object):
@@ -781,15 +1479,25 @@ class SchemaIterator(object):
         Yields:
             One :class:`~fsgop.db.SchemaIterator` for each column in `table`
         """
+        # explicit stack of column iterators and remaining depth, one entry per
+        # element in self._tables
         self._tables.append(self._schema[table])
         self._cols.append(None)
-        for self._cols[-1] in self.table:
+        stack = [(iter(self.table), depth)]
+        while stack:
+            columns, _depth = stack[-1]
+            col = next(columns, None)
+            if col is None:
+                stack.pop()
+                self._cols.pop()
+                self._tables.pop()
+                continue
+            self._cols[-1] = col
             self._index += 1
-            ref_table, ref_col = self.column.ref_info
-            if ref_table is not None and depth != 0:
-                yield from self._iter(ref_table, depth=depth - 1)
+            ref_table = col.ref_info[0]
+            if ref_table is not None and _depth != 0:
+                self._tables.append(self._schema[ref_table])
+                self._cols.append(None)
+                stack.append((iter(self.table), _depth - 1))
             else:
                 yield self
-        self._cols.pop()
-        self._tables.pop()
-        return
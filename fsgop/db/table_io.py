@@ -2,7 +2,10 @@
 
 import csv
 from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
 import re
+import sys
 from pathlib import Path
 
 try:
@@ -11,6 +14,45 @@ try:
 except ImportError:
     WITH_XLSX_SUPPORT = False
 
+# namedtuple types created by CsvParser.parse_header, keyed by field names
+_ROW_TYPE_CACHE = dict()
+
+# converts column headings to valid field names
+_HEADING_TABLE = str.maketrans(" -", "__", ".()")
+
+_NUMBER_FORMAT_PATTERN = re.compile(r"([#0?]*)(?:\.([#0?]*)(E\+0+)?)?")
+
+
+@lru_cache(maxsize=256)
+def _cell_format(data_type, number_format):
+    """Convert Excel number format to python format string
+
+    Results are cached, since worksheets typically use only a few distinct
+    number formats.
+
+    Arguments:
+        data_type (str): openpyxl data type of the cell
+        number_format (str): Excel number format of the cell
+
+    Return:
+        str: Python format string
+    """
+    if data_type != 'n' or number_format is None:
+        return "{}"
+
+    match = _NUMBER_FORMAT_PATTERN.match(number_format)
+    if match is None or match.start() == match.end():
+        return "{}"
+
+    lead, decimal, exp = match.groups()
+    width = ""
+    if lead:
+        width = f"{'0' if lead.startswith('0') else ''}{len(lead)}"
+
+    if decimal is None:
+        return f"{{:{width}d}}"
+    return f"{{:{width}.{len(decimal)}{'f' if exp is None else 'E'}}}"
+
 
 class Xlsx2Csv(object):
     """Adapter for Excel files to expose same interface as csv reader / writer
@@ -19,12 +61,16 @@ class Xlsx2Csv(object):
         path (str): path to Excel xlsv file
         sheet (str): Name of sheet to open. If not provided, the first data sheet
             will be read
-        read_only (bool): Passed verbatim to :func:`openpyxl.load_workbook`
+        read_only (bool): Passed verbatim to :func:`openpyxl.load_workbook`.
+            Defaults to ``True`` for existing files, which streams the
+            worksheet instead of loading it completely. Modifying an existing
+            file requires ``read_only=False``.
         **kwargs (dict): Keyword arguments passed verbatim to
-             :func:`openpyxl.load_workbook`
+             :func:`openpyxl.load_workbook`. If the file is opened read only,
+             ``data_only`` defaults to ``True``.
     """
 
-    NUMBER_FORMAT_PATTERN = re.compile(r"([#0?]*)(?:\.([#0?]*)(E\+0+)?)?")
+    NUMBER_FORMAT_PATTERN = _NUMBER_FORMAT_PATTERN
 
     def __init__(self, path=None, sheet=None, read_only=None, **kwargs):
         self._wb = None
@@ -59,6 +105,9 @@ class Xlsx2Csv(object):
             self._wb = Workbook()
         else:
             self._read_only = bool(read_only) if read_only is not None else True
+            if self._read_only:
+                # return cached values of formula cells instead of formulas
+                kwargs.setdefault("data_only", True)
             self._wb = load_workbook(path, read_only=self._read_only, **kwargs)
         self.open_sheet(sheet)
 
@@ -82,17 +131,37 @@ class Xlsx2Csv(object):
     def writerow(self, row):
         self._ws.append(row)
 
-    def iter_rows(self):
+    def iter_rows(self, formatted=True):
+        """Iterate over all rows of the current sheet
+
+        Arguments:
+            formatted (bool): If ``True`` (default), numbers are formatted
+                according to the number format of their cell. Otherwise values
+                are converted using :func:`str`, which avoids creating a cell
+                object for each value and is considerably faster.
+
+        Yield:
+            tuple: Tuple of strings containing the content of each cell
+        """
         if self._wb is None or self._ws is None:
             return
+        if not formatted:
+            for values in self._ws.iter_rows(values_only=True):
+                yield tuple("" if v is None else str(v) for v in values)
+            return
+        cell_to_str = self.cell_to_str
         for row in self._ws.rows:
-            yield tuple(self.cell_to_str(cell) for cell in row)
+            yield tuple(map(cell_to_str, row))
 
     @classmethod
     def cell_to_str(cls, cell):
-        if cell.value is None:
+        value = cell.value
+        if value is None:
             return ""
-        return cls.cell_format(cell).format(cell.value)
+        if cell.data_type == 's':
+            # text cells are never formatted
+            return value
+        return _cell_format(cell.data_type, cell.number_format).format(value)
 
     @classmethod
     def cell_format(cls, cell):
@@ -104,32 +173,7 @@ class Xlsx2Csv(object):
         Return:
             str: Format string containing the python format for ``cell``
         """
-        if cell.data_type != 'n' or cell.number_format is None:
-            return "{}"
-
-        match = cls.NUMBER_FORMAT_PATTERN.match(cell.number_format)
-        if match is None or match.start() == match.end():
-            return "{}"
-
-        lead, decimal, exp = match.groups()
-
-        fmt = ['{:']
-        if lead:
-            if lead.startswith("0"):
-                fmt.append("0")
-            fmt.append(str(len(lead)))
-
-        if decimal is not None:
-            fmt.append(".{}".format(len(decimal)))
-            if exp is not None:
-                fmt.append("E")
-            else:
-                fmt.append('f')
-        else:
-            fmt.append("d")
-        fmt.append("}")
-
-        return "".join(fmt)
+        return _cell_format(cell.data_type, cell.number_format)
 
 
 class CsvParser(object):
@@ -259,17 +303,13 @@ class CsvParser(object):
             if not row_str:
                 continue
 
-            if self.headings and all([p.search(row_str) for p in self.headings]):
-                names = [
-                    s.replace(' ', '_').replace('-', '_').replace(".", "")
-                     .replace("(", "").replace(")", "")
-                    for s in row
-                ]
+            if self.headings and all(p.search(row_str) for p in self.headings):
                 if self.force_lowercase:
-                    names = [s.lower() for s in names]
-                return header, namedtuple('RowType',
-                                          [self.translate.get(s, s)
-                                           for s in names])
+                    names = [s.translate(_HEADING_TABLE).lower() for s in row]
+                else:
+                    names = [s.translate(_HEADING_TABLE) for s in row]
+                return header, self.make_row_type(self.translate.get(s, s)
+                                                  for s in names)
             for key, pattern in self.header_fields.items():
                 match = pattern.search(row_str)
                 if match:
@@ -288,6 +328,8 @@ class CsvParser(object):
               sheet=None,
               fmt=None,
               encoding="utf-8",
+              buffering=1 << 20,
+              row_type=None,
               **kwargs):
         """Parses a csv file defining the VSC definition
 
@@ -297,6 +339,12 @@ class CsvParser(object):
         Arguments:
             path (str): Path to CSV file
             skip_rows (int): Skip leading rows. Passed verbatim to
+            buffering (int): Size of the read buffer in bytes used for CSV
+                files. Defaults to 1 MiB.
+            row_type (type): If provided, the header is not parsed. Instead
+                `skip_rows` rows are skipped and each following row is
+                converted to `row_type`. Use :meth:`make_row_type` to create a
+                row type from a list of column names.
             **kwargs: Keyword arguments passed verbatim to csv.reader
 
         Yield:
@@ -309,16 +357,42 @@ class CsvParser(object):
             fmt = "csv"
 
         if fmt == "xlsx":
-            with Xlsx2Csv(path, sheet=sheet, **kwargs) as xlsx_file:
-                reader = iter(xlsx_file)
-                self.header, self.row_type = self.parse_header(reader, skip_rows)
-                yield from self.iter_body(reader)
+            source = Xlsx2Csv(path, sheet=sheet, **kwargs)
+            reader = iter(source)
         else:
-            with open(path, newline='', encoding=encoding) as csv_file:
-                reader = csv.reader(csv_file, **kwargs)
-                self.header, self.row_type = self.parse_header(reader, skip_rows)
-                yield from self.iter_body(reader)
-        return
+            source = open(path,
+                          newline='',
+                          encoding=encoding,
+                          buffering=buffering)
+            reader = csv.reader(source, **kwargs)
+
+        with source:
+            if row_type is None:
+                self.header, self.row_type = self.parse_header(reader,
+                                                               skip_rows)
+            else:
+                self.header, self.row_type = dict(), row_type
+                for _ in islice(reader, max(skip_rows, 0)):
+                    pass
+            yield from self.iter_body(reader)
+
+    @staticmethod
+    def make_row_type(fields):
+        """Get row type for a list of column names
+
+        Arguments:
+            fields (list): Names of all columns
+
+        Return:
+            type: namedtuple type with one field per column. Identical column
+            names yield identical types.
+        """
+        fields = tuple(sys.intern(s) for s in fields)
+        row_type = _ROW_TYPE_CACHE.get(fields)
+        if row_type is None:
+            row_type = namedtuple('RowType', fields)
+            _ROW_TYPE_CACHE[fields] = row_type
+        return row_type
 
     @staticmethod
     def _tuple(*args):
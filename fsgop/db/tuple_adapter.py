@@ -1,9 +1,23 @@
-from typing import Optional, Type, Iterable, Tuple
+from typing import Optional, Type, Iterable, Tuple, List, Callable
 from collections import namedtuple
 
 from .utils import Sequence
 
 
+def _split_name(name: str) -> Tuple[str, str]:
+    """Split a name of the form ``'<last name>, <first name>'``
+
+    Args:
+        name: Combined name
+
+    Returns:
+        First name and last name. The first name is empty, if `name` does not
+        contain a comma.
+    """
+    last_name, _, first_name = name.partition(",")
+    return first_name.strip(), last_name.strip()
+
+
 class AdapterBase(object):
     """Modifies each tuple in a sequence of tuples
 
@@ -14,7 +28,11 @@ class AdapterBase(object):
     def __init__(self) -> None:
         self._copy = []  # list of fields copied from input tuples
         self._add = []   # list of additional fields created by this class
+        self._copy_idx = []  # positions of copied fields in input tuples
+        self._add_idx = []   # positions of fields in _add in input tuples
         self._result_type = None
+        self._row_fn = None  # specialized version of __call__
+        self._configs = dict()  # input type -> configuration
 
     def __call__(self, t: namedtuple) -> namedtuple:
         """Convert input tuple to output tuple
@@ -66,6 +84,40 @@ class AdapterBase(object):
         """
         raise NotImplementedError()
 
+    def arg_expressions(self) -> Optional[Tuple[List[str], dict]]:
+        """Get python expressions computing the arguments of the output tuple
+
+        May be implemented by the derived class to speed up the conversion. The
+        expressions are compiled into a single function, which replaces the
+        generic combination of :meth:`__call__` and :meth:`iter_args`.
+
+        Returns:
+            ``None`` if not supported. Otherwise a tuple containing a list of
+            expressions, which may refer to the input tuple as ``t``, and a
+            dictionary with the values of all other names used in these
+            expressions.
+        """
+        return None
+
+    def create_row_function(self) -> Callable:
+        """Create a function converting a single input tuple
+
+        Returns:
+            Function with the same semantics as :meth:`__call__`. The function
+            is specialized for the current input type, if the derived class
+            implements :meth:`arg_expressions`.
+        """
+        code = self.arg_expressions()
+        if code is None:
+            return self
+        expressions, constants = code
+        namespace = dict(constants, _tp=self._result_type)
+        args = "".join(f", {k}={k}" for k in namespace)
+        exec(f"def convert(t{args}):\n"
+             f"    return _tp({', '.join(expressions)})\n",
+             namespace)
+        return namespace["convert"]
+
     def apply_to(self,
                  records: Iterable[namedtuple],
                  rectype: Optional[Type[namedtuple]] = None
@@ -78,22 +130,42 @@ class AdapterBase(object):
 
         Returns:
             tuple containing a generator of output tuples and the type of the
-            output tuples.
+            output tuples. The configuration is cached for each input type,
+            i.e. identical input types yield identical output types.
         """
-        self._copy.clear()
-        self._add.clear()
-        self._result_type = None
         if rectype is None:
             seq = Sequence(records)
             rectype = seq.element_type
             records = seq
 
-        if rectype is not None:
-            # seq is not empty
+        if rectype is None:
+            # seq is empty
+            self._copy, self._add = [], []
+            self._copy_idx, self._add_idx = [], []
+            self._result_type = None
+            self._row_fn = None
+            return records, rectype
+
+        config = self._configs.get(rectype)
+        if config is None:
+            self._copy, self._add = [], []
+            self._copy_idx, self._add_idx = [], []
+            self._result_type = None
             self.configure_for(rectype)
-            if self:
-                return map(self, records), self._result_type
-
+            # configuration is fixed from now on
+            self._copy, self._add = tuple(self._copy), tuple(self._add)
+            self._copy_idx = tuple(self._copy_idx)
+            self._add_idx = tuple(self._add_idx)
+            self._row_fn = self.create_row_function() if self else None
+            config = (self._copy, self._add, self._copy_idx, self._add_idx,
+                      self._result_type, self._row_fn)
+            self._configs[rectype] = config
+        else:
+            (self._copy, self._add, self._copy_idx, self._add_idx,
+             self._result_type, self._row_fn) = config
+
+        if self:
+            return map(self._row_fn, records), self._result_type
         return records, rectype
 
 
@@ -104,16 +176,17 @@ class NameAdapter(AdapterBase):
         rectype: Type of the input tuple.
     """
     def configure_for(self, rectype: Type[namedtuple]) -> None:
+        index = {name: i for i, name in enumerate(rectype._fields)}
         add = []
         for key in rectype._fields:
             if not key.endswith("name") or key.endswith("nickname"):
                 copy, prefix = True, None
             elif key.endswith("first_name"):
                 prefix = key[:-10]
-                copy = f"{prefix}last_name" in rectype._fields
+                copy = f"{prefix}last_name" in index
             elif key.endswith("last_name"):
                 prefix = key[:-9]
-                copy = f"{prefix}first_name" in rectype._fields
+                copy = f"{prefix}first_name" in index
             else:
                 copy, prefix = False, key[:-4]
 
@@ -121,12 +194,14 @@ class NameAdapter(AdapterBase):
                 self._copy.append(key)
             else:
                 names = [f"{prefix}{s}" for s in ("first_name", "last_name")]
-                if not all(s in rectype._fields or s in add for s in names):
+                if not all(s in index or s in add for s in names):
                     add.extend(names)
         if add:
             self._result_type = namedtuple(f"Modified{rectype.__name__}",
                                            self._copy + add)
             self._add = [f"{s[:-10]}name" for s in add[::2]]  # first names only
+            self._copy_idx = [index[s] for s in self._copy]
+            self._add_idx = [index[s] for s in self._add]
 
     def iter_args(self, t: namedtuple) -> Iterable:
         """Iterate over arguments of output tuple
@@ -137,14 +212,22 @@ class NameAdapter(AdapterBase):
         Yields:
             Arguments of the output tuple
         """
-        for f in self._copy:
-            yield getattr(t, f)
+        for i in self._copy_idx:
+            yield t[i]
 
-        for f in self._add:
-            n = getattr(t, f).split(",", maxsplit=1) + [""]
-            last_name, first_name = n[:2]
-            yield first_name.strip()
-            yield last_name.strip()
+        for i in self._add_idx:
+            yield from _split_name(t[i])
+
+    def arg_expressions(self) -> Tuple[List[str], dict]:
+        """Get python expressions computing the arguments of the output tuple
+
+        Returns:
+            Expressions and referenced names as described in
+            :meth:`AdapterBase.arg_expressions`
+        """
+        return ([f"t[{i}]" for i in self._copy_idx]
+                + [f"*_split(t[{i}])" for i in self._add_idx],
+                {"_split": _split_name})
 
 
 class DateTimeAdapter(AdapterBase):
@@ -152,10 +235,13 @@ class DateTimeAdapter(AdapterBase):
 
     Args:
         delimiter: Delimiter used to join time and date strings
+        strip: If ``True``, leading and trailing whitespace is removed from
+            date and time strings before joining them. Defaults to ``False``.
     """
-    def __init__(self, delimiter: str = " "):
+    def __init__(self, delimiter: str = " ", strip: bool = False):
         super().__init__()
         self._delimiter = delimiter
+        self._strip = bool(strip)
 
     def configure_for(self, rectype: Type[namedtuple]) -> None:
         self._copy = list(rectype._fields)
@@ -176,6 +262,9 @@ class DateTimeAdapter(AdapterBase):
             add = ["_".join(s2.split("_")[:-1]).strip() for s1, s2 in self._add]
             self._result_type = namedtuple(f"Modified{rectype.__name__}",
                                            self._copy + add)
+            index = {name: i for i, name in enumerate(rectype._fields)}
+            self._copy_idx = [index[s] for s in self._copy]
+            self._add_idx = [(index[s1], index[s2]) for s1, s2 in self._add]
 
     def iter_args(self, t: namedtuple) -> Iterable:
         """Iterate over arguments of output tuple
@@ -186,11 +275,31 @@ class DateTimeAdapter(AdapterBase):
         Yields:
             Arguments of the output tuple
         """
-        for f in self._copy:
-            yield getattr(t, f)
+        for i in self._copy_idx:
+            yield t[i]
+
+        delimiter = self._delimiter
+        if self._strip:
+            for i1, i2 in self._add_idx:
+                yield t[i1].strip() + delimiter + t[i2].strip()
+        else:
+            for i1, i2 in self._add_idx:
+                yield t[i1] + delimiter + t[i2]
 
-        for f1, f2 in self._add:
-            yield self._delimiter.join((getattr(t, f1), getattr(t, f2)))
+    def arg_expressions(self) -> Tuple[List[str], dict]:
+        """Get python expressions computing the arguments of the output tuple
+
+        Returns:
+            Expressions and referenced names as described in
+            :meth:`AdapterBase.arg_expressions`
+        """
+        if self._strip:
+            fmt = "t[{}].strip() + _d + t[{}].strip()"
+        else:
+            fmt = "t[{}] + _d + t[{}]"
+        return ([f"t[{i}]" for i in self._copy_idx]
+                + [fmt.format(i1, i2) for i1, i2 in self._add_idx],
+                {"_d": self._delimiter})
 
 
 def apply(adapters: Iterable[AdapterBase],
@@ -1,7 +1,10 @@
-from typing import Iterable, Optional, Union
+from typing import Iterable, Iterator, Optional, Union, Callable
 import re
+import codecs
 from datetime import date, datetime
 from itertools import chain, islice
+from functools import partial, lru_cache
+from operator import attrgetter
 
 DATE_FORMAT = "%Y-%m-%d"
 TIME_FORMAT = "%H:%M:%S"
@@ -21,20 +24,209 @@ REPLACEMENTS = {
 ASCII = str.maketrans(REPLACEMENTS)
 
 
-def from_str(string, cls, **kwargs):
+@lru_cache(maxsize=4096)
+def ascii_fold(s: str) -> str:
+    """Replace german umlauts and apostrophes as defined in REPLACEMENTS
+
+    Results are cached, since names usually repeat many times.
+
+    Arguments:
+        s: Input string
+
+    Return:
+        str: Input string translated using :data:`ASCII`
+    """
+    return s.translate(ASCII)
+
+
+# ASCII characters removed by ASCII. All other replaced characters are
+# non-ASCII, so pure ASCII input only requires deleting these.
+_ASCII_DELETE = bytes(ord(k) for k, v in REPLACEMENTS.items()
+                      if ord(k) < 128 and not v)
+
+# codecs encoding ASCII characters as single identical bytes
+_ASCII_COMPATIBLE = frozenset({
+    "ascii",
+    "utf-8",
+    "iso8859-1",
+    "iso8859-15",
+    "cp1250",
+    "cp1252"
+})
+
+
+def ascii_fold_bytes(buf: bytes, encoding: str = "utf-8") -> str:
+    """Decode bytes and replace characters as defined in REPLACEMENTS
+
+    Pure ASCII input in an ASCII compatible encoding like UTF-8 or Latin-1 is
+    translated as bytes before decoding it, which avoids the lookup of each
+    character in :data:`ASCII`.
+
+    Arguments:
+        buf: Encoded input string
+        encoding: Encoding of *buf*. Defaults to ``"utf-8"``.
+
+    Return:
+        str: Same as ``buf.decode(encoding).translate(ASCII)``
+    """
+    if codecs.lookup(encoding).name in _ASCII_COMPATIBLE:
+        try:
+            return buf.translate(None, _ASCII_DELETE).decode("ascii")
+        except UnicodeDecodeError:
+            pass
+    return buf.decode(encoding).translate(ASCII)
+
+
+# datetime.fromisoformat is only available in python >= 3.7
+_HAS_FROMISOFORMAT = hasattr(datetime, "fromisoformat")
+
+# (cls, datetime format, date format) -> function converting a string to cls
+_STR_PARSERS = dict()
+
+
+def _identity(string):
+    return string
+
+
+def _parse_datetime(string, fmt):
+    if not string:
+        return None
+    return datetime.strptime(string, fmt)
+
+
+def _parse_date(string, fmt):
+    if not string:
+        return None
+    return datetime.strptime(string, fmt).date()
+
+
+def _parse_iso_datetime(string):
+    """Parse string in default datetime format
+
+    Strings with the exact layout of :data:`DATE_TIME_FORMAT` are parsed by
+    :meth:`datetime.fromisoformat`, which is much faster than
+    :meth:`datetime.strptime`. Everything else is left to the latter.
+    """
+    if not string:
+        return None
+    # check separators, since fromisoformat accepts more formats than strptime
+    if len(string) == 19 and string[4:20:3] == "-- ::":
+        try:
+            return datetime.fromisoformat(string)
+        except ValueError:
+            pass
+    return datetime.strptime(string, DATE_TIME_FORMAT)
+
+
+def _date_from_slices(string):
+    """Create date from the fields of a string with layout YYYY-MM-DD
+
+    Replacement for :meth:`date.fromisoformat` on Python versions before 3.7.
+    """
+    year, month, day = string[:4], string[5:7], string[8:]
+    if not (year + month + day).isdigit():
+        raise ValueError(f"Invalid date string: '{string}'")
+    return date(int(year), int(month), int(day))
+
+
+_date_from_iso = date.fromisoformat if _HAS_FROMISOFORMAT else _date_from_slices
+
+
+def _parse_iso_date(string):
+    """Parse string in default date format
+
+    Same as :func:`_parse_iso_datetime`, but for :data:`DATE_FORMAT`. Falls
+    back to converting the fields of the string directly, if
+    :meth:`date.fromisoformat` is not available.
+    """
+    if not string:
+        return None
+    # check separators, since fromisoformat accepts more formats than strptime
+    if len(string) == 10 and string[4:8:3] == "--":
+        try:
+            return _date_from_iso(string)
+        except ValueError:
+            pass
+    return datetime.strptime(string, DATE_FORMAT).date()
+
+
+def _create_str_parser(cls, datetime_fmt, date_fmt):
+    """Create a function converting a string into an instance of cls
+
+    Arguments:
+        cls (type): Output type
+        datetime_fmt (str): Format used for datetime objects
+        date_fmt (str): Format used for date objects
+
+    Return:
+        callable: Unary function converting a string into an instance of `cls`
+    """
     if issubclass(cls, str):
-        return string
+        return _identity
     if issubclass(cls, datetime):
-        if not string:
-            return None
-        return datetime.strptime(string,
-                                 kwargs.get("datetime_fmt", DATE_TIME_FORMAT))
+        if datetime_fmt == DATE_TIME_FORMAT and _HAS_FROMISOFORMAT:
+            return _parse_iso_datetime
+        return partial(_parse_datetime, fmt=datetime_fmt)
     if issubclass(cls, date):
-        if not string:
-            return None
-        return datetime.strptime(string,
-                                 kwargs.get("date_fmt", DATE_FORMAT)).date()
-    return cls(string)
+        if date_fmt == DATE_FORMAT:
+            return _parse_iso_date
+        return partial(_parse_date, fmt=date_fmt)
+    return cls
+
+
+def from_str(string, cls, **kwargs):
+    key = (cls,
+           kwargs.get("datetime_fmt", DATE_TIME_FORMAT),
+           kwargs.get("date_fmt", DATE_FORMAT))
+    parser = _STR_PARSERS.get(key)
+    if parser is None:
+        parser = _create_str_parser(*key)
+        _STR_PARSERS[key] = parser
+    return parser(string)
+
+
+def _isinstance(obj, cls):
+    """Same as isinstance, but returns ``False`` if cls is not a class"""
+    return isinstance(cls, type) and isinstance(obj, cls)
+
+
+def _str_to(cls, obj, kwargs):
+    if not isinstance(cls, type):
+        # cls is not a class -> assume it is callable
+        return cls(obj)
+    if isinstance(obj, cls):
+        return obj
+    return from_str(obj, cls, **kwargs)
+
+
+def _dict_to(cls, obj, kwargs):
+    if _isinstance(obj, cls):
+        return obj
+    return cls(**obj)
+
+
+def _tuple_to(cls, obj, kwargs):
+    if _isinstance(obj, cls):
+        return obj
+    return cls(*obj)
+
+
+def _none_to(cls, obj, kwargs):
+    if _isinstance(obj, cls):
+        return obj
+    try:
+        return kwargs['default']
+    except KeyError:
+        raise ValueError("Value may not be <None>")
+
+
+# conversion functions for the most common exact types of obj in to()
+_TO_DISPATCH = {
+    str: _str_to,
+    dict: _dict_to,
+    tuple: _tuple_to,
+    type(None): _none_to
+}
 
 
 def to(cls, obj, **kwargs):
@@ -52,14 +244,18 @@ def to(cls, obj, **kwargs):
     Return:
           obj: Instance of `cls` or ``None``
     """
-    try:
+    if type(obj) is cls:
+        return obj
+    convert = _TO_DISPATCH.get(type(obj))
+    if convert is not None:
+        return convert(cls, obj, kwargs)
+
+    # subclasses of the types above and everything else
+    if isinstance(cls, type):
         if isinstance(obj, cls):
             return obj
         if isinstance(obj, str):
             return from_str(obj, cls, **kwargs)
-    except TypeError:
-        # cls is not a class -> assume it is callable
-        pass
     if isinstance(obj, dict):
         return cls(**obj)
     if isinstance(obj, tuple):
@@ -68,24 +264,24 @@ def to(cls, obj, **kwargs):
             return cls(**obj._asdict())
         except AttributeError:
             return cls(*obj)
-    if obj is None:
-        try:
-            return kwargs['default']
-        except KeyError:
-            raise ValueError("Value may not be <None>")
     return cls(obj)
 
 
+@lru_cache(maxsize=256)
 def get_key_value_pattern(key: str) -> Pattern:
     """Get regular expression pattern for key value pairs in comments
 
+    Patterns are cached, since only a few distinct keys are used. The key is
+    matched literally and must not be preceded by a word character. The only
+    group of the pattern captures the value.
+
     Arguments:
         key(str): Key to search for
 
     Return:
         re.Pattern: Regular expression pattern matching key
     """
-    return re.compile("".join([f"({key})", r"\s*[=:]\s*'([^']+)';?"]))
+    return re.compile(rf"(?<!\w){re.escape(key)}\s*[=:]\s*'([^']*)';?")
 
 
 def iter_attrs(cls, ignore=None):
@@ -131,6 +327,11 @@ def all_attrs_equal(cls1, cls2, ignore=None):
         bool: ``True`` if and only if all not ignored members in *cls1* and *cls2*
         compare equal.
     """
+    if type(cls1) is type(cls2):
+        # identical instance dicts imply equality of any subset of members
+        members = getattr(cls1, "__dict__", None)
+        if members is not None and members == getattr(cls2, "__dict__", None):
+            return True
     for name, val in iter_attrs(cls1, ignore):
         try:
             if val != getattr(cls2, name):
@@ -146,10 +347,12 @@ def find_key_value_pair(s: str,
 
     Args:
         s: String to search
-        key: Either a regular expression pattern or a key name
+        key: Either a regular expression pattern or a key name. Key names are
+            matched literally, use a pattern to match keys by expression.
 
     Returns:
-        Match object if key is found, else ``None``
+        Match object if key is found, else ``None``. The last group of the
+        match contains the value.
     """
     if not s:
         return None
@@ -166,6 +369,9 @@ def get_value(s: str, key: Union[str, Pattern]) -> Optional[str]:
     Args:
         s: string to search for key value pattern
         key: Name of key to retrieve or regular expression Pattern instance.
+            Key names are matched literally. The value is taken from the last
+            group of a pattern, so patterns with a separate key group as
+            well as patterns with a single value group are supported.
 
     Return:
         value associated with *key* or ``None`` if *key* does not exist.
@@ -173,7 +379,7 @@ def get_value(s: str, key: Union[str, Pattern]) -> Optional[str]:
     match = find_key_value_pair(s, key)
     if not match:
         return None
-    return match.group(2)
+    return match.group(match.re.groups)
 
 
 def set_value(key: str, value: Optional[str], s: str = "") -> str:
@@ -200,11 +406,11 @@ def set_value(key: str, value: Optional[str], s: str = "") -> str:
     if match:
         # key exists -> replace
         if value is not None:
-            return "".join([s[0:match.start(2)], f"{value}", s[match.end(2):]])
+            return f"{s[:match.start(1)]}{value}{s[match.end(1):]}"
         else:
-            return "".join([s[0:match.start()], s[match.end():]]).strip()
+            return f"{s[:match.start()]}{s[match.end():]}".strip()
     else:
-        return "; ".join([s, f"{key}='{value}'"]) if value is not None else s
+        return f"{s}; {key}='{value}'" if value is not None else s
 
 
 def kwargs_from(obj: object, layout: dict, *args) -> dict:
@@ -232,7 +438,38 @@ def kwargs_from(obj: object, layout: dict, *args) -> dict:
     }
 
 
-def chunk(seq: Iterable, n: int = 1) -> Iterable:
+def _attr_getter(name: str, *args) -> Callable[[object], object]:
+    """Create unary function equivalent to ``getattr(obj, name, *args)``"""
+    if not args and "." not in name:
+        return attrgetter(name)
+    return lambda obj: getattr(obj, name, *args)
+
+
+def compile_layout(layout: dict, *args) -> Callable[[object], dict]:
+    """Compile a layout into a function extracting keyword arguments
+
+    Traverses the layout once, so that extracting keyword arguments from many
+    objects with the same layout does not need to inspect the layout again.
+
+    Args:
+        layout: Output structure as described in :func:`kwargs_from`
+        *args: Passed verbatim to getattr. Only use is to specify a default
+            value to return if an argument is not found.
+
+    Returns:
+        Unary function returning the same result for an object as
+        ``kwargs_from(obj, layout, *args)``. Later changes of *layout* are not
+        reflected by the function.
+    """
+    items = tuple(
+        (k, _attr_getter(v, *args)
+         if isinstance(v, str) else compile_layout(v, *args))
+        for k, v in layout.items()
+    )
+    return lambda obj: {k: get(obj) for k, get in items}
+
+
+def chunk(seq: Iterable, n: int = 1, materialize: bool = True) -> Iterable:
     """Read sequence in chunks of a given size
 
     Args:
@@ -241,6 +478,9 @@ def chunk(seq: Iterable, n: int = 1) -> Iterable:
            be returned in a single chunk. If n is one, then individual elements
            of the sequence will be returned one by one. Otherwise elements will
            be returned in chunks of size `n`.
+        materialize: If ``True``, chunks of size `n` are returned as lists.
+           Otherwise they are returned as iterators, which must be consumed
+           before the next chunk is requested. Defaults to ``True``.
 
     Yields:
         Chunks of size 'n' or less (if end of the sequence is reached)
@@ -251,28 +491,34 @@ def chunk(seq: Iterable, n: int = 1) -> Iterable:
         yield from seq
     else:
         it = iter(seq)
-        for first in it:
-            yield chain((first,), islice(it, n - 1))
+        if materialize:
+            for first in it:
+                yield [first, *islice(it, n - 1)]
+        else:
+            for first in it:
+                yield chain((first,), islice(it, n - 1))
 
 
 class Sequence(object):
     """Analyse sequence objects
 
     Allows to analyse the first element of a sequence and to iterate over the
-    entire sequence including the first element
+    entire sequence including the first element. Like any iterator, the
+    sequence can be iterated only once.
 
     Args:
         seq: Sequence to analyse and wrap
     """
+    __slots__ = ("_iter", "_first")
+
     def __init__(self, seq: Iterable):
         self._iter = iter(seq)
         self._first = next(self._iter, None)
-
-    def __iter__(self) -> Iterable:
         if self._first is not None:
-            yield from chain((self._first,), self._iter)
-        else:
-            yield from self._iter
+            self._iter = chain((self._first,), self._iter)
+
+    def __iter__(self) -> Iterator:
+        return self._iter
 
     def __bool__(self):
         return self._first is not None
@@ -1,5 +1,7 @@
-from typing import Optional, Union, Iterable, Set
+from typing import Optional, Union, Iterable, FrozenSet, List, Sequence
 from datetime import datetime
+from itertools import repeat
+import sys
 from .record import Record, to
 from .property import Property
 
@@ -13,6 +15,49 @@ WINCH = 11
 CAR = 12
 UNDEFINED = 9999  # use this value only to indicate errors/warnings
 
+_NO_LICENCES = frozenset()
+_GLIDER_CATEGORIES = frozenset({GLIDER, MOTOR_GLIDER})
+
+
+def _to_str(obj) -> Optional[str]:
+    """Shortcut for ``to(str, obj, default=None)`` handling the common cases"""
+    if obj is None or type(obj) is str:
+        return obj
+    return to(str, obj, default=None)
+
+
+def _to_interned_str(obj) -> Optional[str]:
+    """Same as :func:`_to_str`, but interns the result
+
+    Used for low cardinality fields repeated across many vehicles.
+    """
+    s = _to_str(obj)
+    return sys.intern(s) if type(s) is str else s
+
+
+def _to_int(obj, default: Optional[int] = None) -> Optional[int]:
+    """Shortcut for ``to(int, obj, default=default)`` handling integers"""
+    if type(obj) is int:
+        return obj
+    return to(int, obj, default=default)
+
+
+def _column(values: Iterable) -> Sequence:
+    """Get column values as sequence of native python objects
+
+    Args:
+        values: Column values. Arrays providing a ``tolist`` method (e.g.
+            numpy arrays or pandas series) are converted in a single call.
+            Other iterables without length are converted to a list.
+
+    Returns:
+        Sequence of the column values
+    """
+    tolist = getattr(values, "tolist", None)
+    if tolist is not None:
+        return tolist()
+    return values if hasattr(values, "__len__") else list(values)
+
 
 class Vehicle(Record):
     """Native vehicle model
@@ -26,6 +71,8 @@ class Vehicle(Record):
         category: Category. One of the values in CATEGORIES.
         comments: any comment
     """
+    __slots__ = ("manufacturer", "model", "serial_number", "num_seats",
+                 "category", "comments")
     index = ["manufacturer", "serial_number"]
     categories = {
         "single engine piston": SINGLE_ENGINE_PISTON,
@@ -39,18 +86,21 @@ class Vehicle(Record):
     }
 
     accepted_pic_licences = {
-        SINGLE_ENGINE_PISTON: {"PPL(A)-SEP"},
-        ULTRALIGHT: {"PPL(A)", "LAPL(A)"},
-        TOURING_MOTOR_GLIDER: {"SPL-TMG", "PPL(A)-TMG", "LAPL(A)-TMG", "LAPL(S)-TMG"},
-        GLIDER: {"SPL", "LAPL(S)"},
-        WINCH: {"WINDENSCHEIN"}
+        SINGLE_ENGINE_PISTON: frozenset({"PPL(A)-SEP"}),
+        ULTRALIGHT: frozenset({"PPL(A)", "LAPL(A)"}),
+        TOURING_MOTOR_GLIDER: frozenset({"SPL-TMG",
+                                         "PPL(A)-TMG",
+                                         "LAPL(A)-TMG",
+                                         "LAPL(S)-TMG"}),
+        GLIDER: frozenset({"SPL", "LAPL(S)"}),
+        WINCH: frozenset({"WINDENSCHEIN"})
     }
 
     accepted_instructor_licences = {
-        SINGLE_ENGINE_PISTON: {"FI(A)-SEP"},
-        ULTRALIGHT: {"FI(A)"},
-        TOURING_MOTOR_GLIDER: {"FI(A)-TMG", "FI(S)-TMG"},
-        GLIDER: {"FI(S)"}
+        SINGLE_ENGINE_PISTON: frozenset({"FI(A)-SEP"}),
+        ULTRALIGHT: frozenset({"FI(A)"}),
+        TOURING_MOTOR_GLIDER: frozenset({"FI(A)-TMG", "FI(S)-TMG"}),
+        GLIDER: frozenset({"FI(S)"})
     }
 
     def __init__(self,
@@ -63,15 +113,15 @@ class Vehicle(Record):
                  registration: Optional[Union["VehicleProperty", str]] = None,
                  comments: Optional[str] = None) -> None:
         super().__init__(uid=uid)
-        self.manufacturer = to(str, manufacturer, default=None)
-        self.model = to(str, model, default=None)
-        self.serial_number = to(str, serial_number, default=None)
-        self.num_seats = to(int, num_seats, default=1)
+        self.manufacturer = _to_interned_str(manufacturer)
+        self.model = _to_interned_str(model)
+        self.serial_number = _to_str(serial_number)
+        self.num_seats = _to_int(num_seats, default=1)
         if isinstance(category, str):
             self.category = self.categories[category]
         else:
-            self.category = to(int, category, default=None)
-        self.comments = to(str, comments, default=None)
+            self.category = _to_int(category)
+        self.comments = _to_str(comments)
 
         if registration:
             if isinstance(registration, str):
@@ -81,6 +131,82 @@ class Vehicle(Record):
             reg.kind = "registration"
             reg.add_to(self)
 
+    @classmethod
+    def from_columns(cls,
+                     uid: Optional[Iterable[Optional[int]]] = None,
+                     manufacturer: Optional[Iterable[Optional[str]]] = None,
+                     model: Optional[Iterable[Optional[str]]] = None,
+                     serial_number: Optional[Iterable[Optional[str]]] = None,
+                     num_seats: Optional[Iterable[Optional[int]]] = None,
+                     category: Optional[Iterable] = None,
+                     registration: Optional[Iterable[Optional[str]]] = None,
+                     comments: Optional[Iterable[Optional[str]]] = None
+                     ) -> List["Vehicle"]:
+        """Create vehicles from columns of tabular data
+
+        Equivalent to calling the constructor once per row, but converts each
+        column in one pass and assigns attributes directly.
+
+        Args:
+            uid: Column of unique vehicle IDs
+            manufacturer: Column of manufacturer names
+            model: Column of models
+            serial_number: Column of serial numbers
+            num_seats: Column of number of seats. Missing values (``None`` or
+                NaN) yield ``None`` rather than the default used by the
+                constructor.
+            category: Column of categories, either as integer or as string
+            registration: Column of registrations
+            comments: Column of comments
+
+        Omitted columns are filled with ``None``. At least one column must be
+        provided and all provided columns must have the same length.
+
+        Returns:
+            List of vehicles, one for each row.
+
+        Raises:
+            ValueError: If all columns are ``None`` or if the columns differ in
+                length
+        """
+        columns = [x if x is None else _column(x)
+                   for x in (uid, manufacturer, model, serial_number,
+                             num_seats, category, registration, comments)]
+        lengths = {len(x) for x in columns if x is not None}
+        if not lengths:
+            raise ValueError("At least one column is required")
+        if len(lengths) > 1:
+            raise ValueError(f"Columns differ in length: {sorted(lengths)}")
+        n = lengths.pop()
+        (uid, manufacturer, model, serial_number, num_seats, category,
+         registration, comments) = (repeat(None, n) if x is None else x
+                                    for x in columns)
+        categories = cls.categories
+        rows = zip(
+            map(_to_int, uid),
+            map(_to_interned_str, manufacturer),
+            map(_to_interned_str, model),
+            map(_to_str, serial_number),
+            # pandas yields float NaN for missing values (NaN != NaN)
+            (None if x is None or x != x else _to_int(x) for x in num_seats),
+            (categories[x] if isinstance(x, str) else _to_int(x)
+             for x in category),
+            map(_to_str, comments)
+        )
+        retval = []
+        new = cls.__new__
+        for row, reg in zip(rows, registration):
+            v = new(cls)
+            (v.uid, v.manufacturer, v.model, v.serial_number, v.num_seats,
+             v.category, v.comments) = row
+            v._properties = dict()
+            if reg and reg == reg:  # skip None, empty strings and NaN
+                prop = VehicleProperty(value=_to_str(reg))
+                prop.kind = "registration"
+                prop.add_to(v)
+            retval.append(v)
+        return retval
+
     @property
     def registration(self) -> Optional[str]:
         """Get registration of this vehicle
@@ -101,25 +227,25 @@ class Vehicle(Record):
         return None
 
     @property
-    def pic_licences(self) -> Set[str]:
+    def pic_licences(self) -> FrozenSet[str]:
         """Get list of accepted licences for vehicle operation
 
         Return:
-            Set of strings containing licence types permitting operation
+            Set of strings containing licence types permitting operation. The
+            set is empty, if no licences are known for the vehicle category.
         """
-        return self.accepted_pic_licences[self.category]
+        return self.accepted_pic_licences.get(self.category, _NO_LICENCES)
 
     @property
-    def instructor_licences(self) -> Set[str]:
+    def instructor_licences(self) -> FrozenSet[str]:
         """Get list of licences qualifying for instruction on this vehicle
 
-        Args:
-            lic: Licence property
-
         Return:
-            ``True`` if and only if the licence *lic*
+            Set of strings containing licence types permitting instruction. The
+            set is empty, if no licences are known for the vehicle category.
         """
-        return self.accepted_instructor_licences[self.category]
+        return self.accepted_instructor_licences.get(self.category,
+                                                     _NO_LICENCES)
 
     def is_glider(self) -> bool:
         """Check if vehicle is a glider
@@ -128,8 +254,7 @@ class Vehicle(Record):
             ``True`` if and only if the vehicle is either a glider or a motor
             glider (not a touring motor glider)
         """
-        return (self.category is not None
-                and self.category in (GLIDER, MOTOR_GLIDER))
+        return self.category in _GLIDER_CATEGORIES
 
 
 class VehicleProperty(Property):
@@ -146,6 +271,7 @@ class VehicleProperty(Property):
         kind: Name of this property
         value: Property value
     """
+    __slots__ = ()
     index = [x if x != "rec" else "vehicle" for x in Property.index]
 
     def __init__(self,
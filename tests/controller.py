@@ -6,6 +6,7 @@ from datetime import datetime
 from fsgop.db import Controller, Vehicle
 from fsgop.db import Person, Repository, SqliteDatabase
 from fsgop.db.startkladde import schema_v3 as sk_schema
+from fsgop.db.controller import person_block
 
 
 class ControllerTestCase(unittest.TestCase):
@@ -87,6 +88,29 @@ class ControllerTestCase(unittest.TestCase):
         self.assertListEqual([self.person3],
                              [m.rec1 for m in match if m.rec2 is self.person2])
 
+    def test_match_blocked(self):
+        person4 = Person(first_name="Robert", last_name="Goddard",
+                         birthday="1883-10-05")
+        person5 = Person(first_name="Robert H.", last_name="Goddard")
+        l1 = [self.person1, self.person3]
+        l2 = [self.person1, person4]
+        match = Controller.match(l1, l2, 0.5)
+        self.assertEqual(2, len([m for m in match if None not in m]))
+
+        match = Controller.match(l1, l2, 0.5, block=person_block)
+        self.assertListEqual([self.person3],
+                             [m.rec1 for m in match if m.rec2 is None])
+        self.assertListEqual([person4],
+                             [m.rec2 for m in match if m.rec1 is None])
+
+        l2 = [self.person1, self.person2, person5]
+        match = Controller.match([self.person1, person4], l2, 0.5,
+                                 block=person_block)
+        self.assertListEqual([self.person2],
+                             [m.rec2 for m in match if m.rec1 is None])
+        self.assertListEqual([person4],
+                             [m.rec1 for m in match if m.rec2 is person5])
+
     def test_flights_of(self):
         for ctrl in self.create_ctrl():
             wilbur = Person(last_name="Wright", first_name="Wilbur")
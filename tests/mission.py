@@ -66,6 +66,14 @@ class MissionTestCase(unittest.TestCase):
         self.assertEqual(Mission.categories["normal flight"], m.launch.category)
         self.assertIsNone(m.launch.vehicle)
 
+    def test_slots(self):
+        m = Mission(pilot=self.person1, vehicle=self.vehicle)
+        self.assertFalse(hasattr(m, "__dict__"))
+        self.assertIs(m, m.launch)
+        self.assertEqual([("pilot", self.person1),
+                          ("charge_person", self.person1)],
+                         list(m.select(Person)))
+
     def test_layout(self):
         person_layout = {
             "first_name": "first_name",
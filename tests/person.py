@@ -164,6 +164,13 @@ class PersonTestCase(unittest.TestCase):
         self.assertEqual(5, p.uid)
         self.assertEqual(5, int(p))
 
+    def test_slots(self):
+        p = Person(first_name="Otto", last_name="Lilienthal")
+        self.assertFalse(hasattr(p, "__dict__"))
+        self.assertFalse(hasattr(PersonProperty(kind="a"), "__dict__"))
+        with self.assertRaises(AttributeError):
+            p.nickname = "Otto"
+
     def test_properties(self):
         person = Person(first_name="Otto", last_name="Lilienthal")
         spl = PersonProperty(kind="licence", value="SPL:123456")
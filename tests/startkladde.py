@@ -6,7 +6,7 @@ from datetime import timedelta
 import logging
 from io import StringIO
 
-from fsgop.db import SqliteDatabase, Property
+from fsgop.db import SqliteDatabase, Property, Mission
 import fsgop.db.startkladde as sk
 
 
@@ -85,6 +85,13 @@ class StartkladdeTestCase(unittest.TestCase):
                     med_validity = (med_validity - timedelta(hours=24)).date()
                     self.assertEqual(p1.medical_validity, str(med_validity))
 
+            categories = {m.uid: m.category for m in repo.missions()
+                          if m.launch is not m}
+            normal = Mission.categories["normal flight"]
+            dual = Mission.categories["dual flight instruction"]
+            self.assertDictEqual({16: dual, 21: normal, 31: dual, 32: dual},
+                                 categories)
+
 
 def suite():
     """Get Test suite object
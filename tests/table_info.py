@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
 import unittest
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
 from pathlib import Path
 
 from fsgop.db import TableInfo, ColumnInfo, IndexInfo, Person, sort_tables
-from fsgop.db.table_info import dependencies
+from fsgop.db.table_info import dependencies, WITH_PANDAS_SUPPORT
 from fsgop.db import SchemaIterator
 from fsgop.db import to_schema
 from fsgop.db.startkladde import schema_v3
@@ -45,6 +49,79 @@ class TableInfoTestCase(unittest.TestCase):
         self.assertFalse(col.allows_null)
         self.assertIsNone(col.default_value)
         self.assertEqual('', col.extra)
+        self.assertFalse(col.has_auto_increment())
+
+        col = ColumnInfo(name="id", dtype="int", extra="AUTO_INCREMENT")
+        self.assertTrue(col.has_auto_increment())
+
+    def test_index_construction(self):
+        idx = IndexInfo("idx", columns=[("col1",), ("col2", -1)])
+        self.assertTupleEqual(("col1", "col2"), idx.columns)
+        self.assertEqual("col1,col2 DESC", idx.key_format())
+
+        idx = IndexInfo("idx", columns=[("col2", 1, 1), ("col1", 1, 0)])
+        self.assertTupleEqual(("col1", "col2"), idx.columns)
+        self.assertRaises(ValueError, IndexInfo, "idx", False, False,
+                          [("col1", 1, 0), ("col2", 1, 2)])
+
+    def test_index_comparison(self):
+        secondary, primary = self.get_indices()
+        self.assertLess(primary, secondary)
+        self.assertGreater(secondary, primary)
+        self.assertEqual(hash(primary), hash(self.get_indices()[1]))
+        self.assertEqual(2, len(set(self.get_indices() + self.get_indices())))
+
+        with self.assertRaises(AttributeError):
+            primary.is_primary = False
+        with self.assertRaises(AttributeError):
+            secondary.name = "a"
+
+    def test_column_parser(self):
+        col = ColumnInfo(name="c", dtype="int(11)", allows_null=True,
+                         force_null=True)
+        self.assertIsNone(col._parser("0"))
+        self.assertEqual(3, col._parser("3"))
+        col = ColumnInfo(name="c", dtype="varchar(5)", allows_null=True,
+                         force_null=True)
+        self.assertIsNone(col._parser(""))
+        self.assertIsNone(col._parser(r"\N"))
+        col = ColumnInfo(name="c", dtype="varchar(5)", force_null=True)
+        self.assertEqual("", col._parser(""))
+
+    def test_column_default(self):
+        col = ColumnInfo(name="col", dtype="int")
+        self.assertEqual("NULL", col.default())
+        col.default_value = 5
+        self.assertEqual("'5'", col.default())
+        col.default_value = None
+        self.assertEqual("NULL", col.default())
+
+    def test_column_auto_increment(self):
+        col = ColumnInfo(name="col", dtype="int")
+        self.assertFalse(col.has_auto_increment())
+        col.extra = "auto_increment"
+        self.assertTrue(col.has_auto_increment())
+        col.extra = ""
+        self.assertFalse(col.has_auto_increment())
+
+    def test_column_references(self):
+        col = ColumnInfo(name="pilot", dtype="integer", references="people(id)")
+        self.assertTupleEqual(("people", "id"), col.ref_info)
+        col.references = "persons(uid)"
+        self.assertTupleEqual(("persons", "uid"), col.ref_info)
+        col.references = None
+        self.assertTupleEqual((None, None), col.ref_info)
+        self.assertRaises(ValueError, ColumnInfo, name="pilot", references="(")
+
+    def test_names_are_interned(self):
+        name = "".join(["my", "_", "table"])
+        t = TableInfo(name=name, columns=self.get_columns(),
+                      indices=self.get_indices())
+        self.assertIs(sys.intern(name), t.name)
+        col = ColumnInfo(name="pilot", references="".join(["people", "(id)"]))
+        self.assertIs(sys.intern("people"), col.ref_info[0])
+        idx = dict(t.indices())["secondary"]
+        self.assertIs(sys.intern("col1"), idx.columns[0])
 
     def test_table_construction(self):
         t = TableInfo()
@@ -64,6 +141,25 @@ class TableInfoTestCase(unittest.TestCase):
         t1 = TableInfo(columns=self.get_columns())
         self.assertEqual("(%s,%s,%s)", t1.format())
 
+    def test_column_attributes(self):
+        t = TableInfo(columns=self.get_columns())
+        self.assertTupleEqual(("col1", "col2", "col3"), t.columns)
+        self.assertTupleEqual(("integer", "float", "time"), t.dtypes)
+        self.assertTupleEqual(("NULL", "NULL", "NULL"), t.defaults)
+
+        t.pop_column("col2")
+        self.assertTupleEqual(("col1", "col3"), t.columns)
+        self.assertTupleEqual(("integer", "time"), t.dtypes)
+
+        col = t.get_column("col1")
+        col.dtype = "bigint"
+        col.default_value = 1
+        self.assertTupleEqual(("bigint", "time"), t.dtypes)
+        self.assertTupleEqual(("'1'", "NULL"), t.defaults)
+
+        col.name = "col0"
+        self.assertTupleEqual(("col0", "col3"), t.columns)
+
     def test_get_column(self):
         t = TableInfo(columns=self.get_columns())
         c = t.get_column("col1")
@@ -76,6 +172,30 @@ class TableInfoTestCase(unittest.TestCase):
 
         self.assertRaises(KeyError, t.get_column, "col4")
 
+    def test_get_column_after_rename(self):
+        t = TableInfo(columns=self.get_columns())
+        c = t.get_column("col1")
+        c.name = "col0"
+        self.assertIs(c, t.get_column("col0"))
+        self.assertRaises(KeyError, t.get_column, "col1")
+        self.assertIs(c, t.pop_column("col0"))
+        self.assertTupleEqual(("col2", "col3"), t.columns)
+
+    def test_get_column_after_unpickling(self):
+        t = pickle.loads(pickle.dumps(TableInfo(columns=self.get_columns())))
+        self.assertEqual("col2", t.get_column("col2").name)
+        self.assertRaises(KeyError, t.get_column, "col4")
+
+    def test_column_types(self):
+        t = TableInfo(name="table", columns=self.get_columns())
+        types = t.column_types
+        self.assertIs(types, t.column_types)
+        self.assertTupleEqual((int, float, str), types)
+        t.add_column(ColumnInfo(name="col4", dtype="date"))
+        self.assertTupleEqual((int, float, str, date), t.column_types)
+        t.reset_record_type(aliases={"col1": "first"})
+        self.assertEqual(int, t.column_types.first)
+
     def test_pop_column(self):
         t = TableInfo(columns=self.get_columns())
         c = t.get_column("col1")
@@ -83,6 +203,19 @@ class TableInfoTestCase(unittest.TestCase):
         self.assertIs(c, c1)
         self.assertRaises(KeyError, t.get_column, "col1")
 
+    def test_finalize(self):
+        t1 = TableInfo(columns=self.get_columns(), indices=self.get_indices())
+        t2 = TableInfo(columns=self.get_columns(), indices=self.get_indices())
+        t1.finalize()
+        self.assertIs(t1.columns, t1.columns)
+        self.assertEqual(t1, t2)
+        self.assertEqual("(?,?,?)", t1.format("?"))
+        self.assertRaises(RuntimeError,
+                          t1.add_column,
+                          ColumnInfo(name="col4", dtype="integer"))
+        self.assertRaises(RuntimeError, t1.add_index, self.get_indices()[0])
+        self.assertRaises(RuntimeError, t1.pop_column, "col1")
+
     def test_equals(self):
         t1 = TableInfo(columns=self.get_columns())
         t2 = TableInfo(columns=self.get_columns())
@@ -112,10 +245,45 @@ class TableInfoTestCase(unittest.TestCase):
         self.assertTupleEqual((1, 2.1, datetime(2012, 1, 23, 14, 15, 16)),
                               rec)
 
+    def test_record_type_cache(self):
+        t = TableInfo(name="my_table", columns=self.get_columns())
+        rectype = t.create_record_type(aliases={"col1": "first"})
+        self.assertEqual("MyTableRecord", rectype.__name__)
+        self.assertIs(rectype, t.create_record_type(aliases={"col1": "first"}))
+        self.assertIsNot(rectype, t.create_record_type())
+
+        t.add_column(ColumnInfo(name="col4", dtype="integer"))
+        rectype = t.create_record_type(aliases={"col1": "first"})
+        self.assertTupleEqual(("first", "col2", "col3", "col4"),
+                              rectype._fields)
+
+    def test_to_schema(self):
+        t = TableInfo("t", self.get_columns(), self.get_indices())
+        schema = to_schema({"t": t})
+        self.assertEqual(t, schema["t"])
+        self.assertIsNot(t, schema["t"])
+
+        schema["t"].get_column("col1").dtype = "bigint"
+        schema["t"].pop_column("col3")
+        self.assertEqual("integer", t.get_column("col1").dtype)
+        self.assertTupleEqual(("col1", "col2", "col3"), t.columns)
+        self.assertEqual("PRIMARY KEY (col1 DESC,col2)",
+                         schema["t"].primary_key())
+
     def test_get_primary_key(self):
         t = TableInfo(columns=self.get_columns(), indices=self.get_indices())
         self.assertEqual("PRIMARY KEY (col1 DESC,col2)", t.primary_key())
 
+        secondary, primary = (i for _, i in t.indices())
+        with self.assertRaises(AttributeError):
+            primary.is_primary = False
+        self.assertEqual("PRIMARY KEY (col1 DESC,col2)", t.primary_key())
+
+        t.add_index(IndexInfo("primary", True, False, [("col3", 1, 0)]))
+        self.assertEqual("", t.primary_key())
+        self.assertListEqual(["primary", "secondary"],
+                             [i["name"] for i in t.as_dict()["indices"]])
+
     def test_id_column(self):
         schema = self.get_schema()
         for table in ("people", "flights", "launch_methods"):
@@ -147,6 +315,81 @@ class TableInfoTestCase(unittest.TestCase):
         self.assertEqual("Lilienthal", persons[0].last_name)
         self.assertIsNone(persons[0].uid)
 
+    def test_import_mysql_dump_chunks(self):
+        table = self.get_schema()["people"]
+        path = TEST_DIR / "mysql-dump.tsv"
+        chunks = list(table.read_mysql_dump_chunks(path, chunk_size=2))
+        self.assertListEqual([2, 1], [len(c) for c in chunks])
+        self.assertListEqual(list(table.read_mysql_dump(path)),
+                             [rec for c in chunks for rec in c])
+        with self.assertRaises(ValueError):
+            next(table.read_mysql_dump_chunks(path, chunk_size=0))
+
+    def test_import_mysql_dump_parallel(self):
+        table = self.get_schema()["people"]
+        path = TEST_DIR / "mysql-dump.tsv"
+        aliases = {"medical_validity": "birthday"}
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            recs = list(table.read_mysql_dump_parallel([path, path],
+                                                       executor=executor,
+                                                       aliases=aliases))
+        self.assertListEqual(2 * list(table.read_mysql_dump(path,
+                                                            aliases=aliases)),
+                             recs)
+
+    def test_import_mysql_dump_bulk(self):
+        if not WITH_PANDAS_SUPPORT:
+            self.skipTest("pandas library not found")
+
+        table = self.get_schema()["people"]
+        path = TEST_DIR / "mysql-dump.tsv"
+        aliases = {"medical_validity": "birthday"}
+        self.assertListEqual(
+            list(table.read_mysql_dump(path, aliases=aliases)),
+            list(table.read_mysql_dump_bulk(path, aliases=aliases)))
+
+        table = TableInfo(name="table",
+                          columns=[ColumnInfo(name="col1", dtype="int"),
+                                   ColumnInfo(name="col2", dtype="datetime")])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "dump.tsv"
+            path.write_text('"1"\t"2022-04-07 13:05:00"\n"2"\t\\N\n')
+            recs = list(table.read_mysql_dump_bulk(path))
+            self.assertListEqual(list(table.read_mysql_dump(path)), recs)
+        self.assertIs(datetime, type(recs[0].col2))
+        self.assertIsNone(recs[1].col2)
+
+    def test_row_parser(self):
+        t = TableInfo(name="table",
+                      columns=self.get_columns()[:2]
+                      + [ColumnInfo(name="col3", dtype="date")])
+        parse = t.row_parser(t.record_type)
+        rec = parse(("1", r"\N", "2022-04-07"))
+        self.assertIsInstance(rec, t.record_type)
+        self.assertTupleEqual((1, None, date(2022, 4, 7)), rec)
+        parse = t.row_parser(t.record_type, unpack=True)
+        self.assertEqual(rec, parse("1", r"\N", "2022-04-07"))
+
+    def test_slots_record_type(self):
+        t = TableInfo(name="table", columns=self.get_columns())
+        rectype = t.create_record_type(aliases={"col1": "first"},
+                                       backend="slots")
+        self.assertIs(rectype, t.create_record_type(aliases={"col1": "first"},
+                                                    backend="slots"))
+        self.assertTupleEqual(("first", "col2", "col3"), rectype._fields)
+        rec = t.row_parser(rectype)(("1", "2.5", "a"))
+        self.assertFalse(hasattr(rec, "__dict__"))
+        self.assertEqual(1, rec.first)
+        self.assertTupleEqual((1, 2.5, "a"), tuple(rec))
+        self.assertEqual(rec, rectype._make((1, 2.5, "a")))
+        self.assertDictEqual({"first": 1, "col2": 2.5, "col3": "a"},
+                             rec._asdict())
+        self.assertEqual("TableRecord(first=1, col2=2.5, col3='a')", repr(rec))
+        self.assertRaises(ValueError, t.create_record_type, backend="dict")
+        for alias in ("from", "_first", "1st"):
+            with self.assertRaises(ValueError):
+                t.create_record_type(aliases={"col1": alias}, backend="slots")
+
     def test_references(self):
         schema = self.get_schema()
         refs = schema["people"].get_references()
@@ -161,6 +404,11 @@ class TableInfoTestCase(unittest.TestCase):
         for k in refs.keys():
             self.assertIn(k, {"people", "planes", "launch_methods"})
 
+        flights = schema["flights"]
+        self.assertIn(("pilot_id", "people", "id"), flights.reference_list())
+        flights.get_column("pilot_id").references = "planes(id)"
+        self.assertIn(("pilot_id", "planes", "id"), flights.reference_list())
+
     def test_sort(self):
         schema = self.get_schema()
         sorted_tables = sort_tables(schema.values())
@@ -171,6 +419,18 @@ class TableInfoTestCase(unittest.TestCase):
                               "flights"],
                              [t.name for t in sorted_tables])
 
+    def test_sort_levels(self):
+        def table(name, *refs):
+            return TableInfo(name=name, columns=[
+                ColumnInfo(name=f"c{i}", dtype="integer", references=f"{r}(id)")
+                for i, r in enumerate(refs)])
+
+        tables = [table("b", "a"), table("z"), table("a"), table("c", "b", "z")]
+        self.assertListEqual(["a", "z", "b", "c"],
+                             [t.name for t in sort_tables(tables)])
+        self.assertRaises(ValueError, sort_tables, tables + [table("d", "d")])
+        self.assertRaises(ValueError, sort_tables, [table("e", "missing")])
+
     def test_schema_iterator(self):
         schema = self.get_schema()
         traverse = SchemaIterator(schema)
@@ -1,7 +1,8 @@
 from fsgop.db import CsvParser
-from fsgop.db.table_io import WITH_XLSX_SUPPORT
+from fsgop.db.table_io import WITH_XLSX_SUPPORT, Xlsx2Csv
 
 import unittest
+from collections import namedtuple
 from pathlib import Path
 
 
@@ -57,6 +58,17 @@ class TableIOTestCase(unittest.TestCase):
         self.assertEqual("Lilienthal", retval[0].pilot_last_name)
         self.assertEqual("Harald", retval[1].pilot_first_name)
 
+        row_type = reader.row_type
+        list(reader(self.test_dir / "startkladde-format.csv"))
+        self.assertIs(row_type, reader.row_type)
+
+        parser = CsvParser()
+        records = list(parser(self.test_dir / "startkladde-format.csv",
+                              skip_rows=1,
+                              row_type=row_type))
+        self.assertListEqual(retval, records)
+        self.assertIs(row_type, CsvParser.make_row_type(expected_columns))
+
     def test_excel(self):
         if not WITH_XLSX_SUPPORT:
             self.skipTest("openpyxl library not found")
@@ -79,6 +91,21 @@ class TableIOTestCase(unittest.TestCase):
         self.assertEqual(retval[2].Heading2, "3")
         self.assertEqual(retval[2].Heading3, "0.3")
 
+    def test_cell_format(self):
+        cell = namedtuple("Cell", ["data_type", "number_format"])
+        self.assertEqual("{}", Xlsx2Csv.cell_format(cell("s", "0.00")))
+        self.assertEqual("{}", Xlsx2Csv.cell_format(cell("n", None)))
+        self.assertEqual("{}", Xlsx2Csv.cell_format(cell("n", "General")))
+        self.assertEqual("{:02d}", Xlsx2Csv.cell_format(cell("n", "00")))
+        self.assertEqual("{:2.1f}", Xlsx2Csv.cell_format(cell("n", "##.0")))
+        self.assertEqual("{:01.2E}",
+                         Xlsx2Csv.cell_format(cell("n", "0.00E+00")))
+
+        cell = namedtuple("Cell", ["value", "data_type", "number_format"])
+        self.assertEqual("", Xlsx2Csv.cell_to_str(cell(None, "n", "0.00")))
+        self.assertEqual("0.0", Xlsx2Csv.cell_to_str(cell("0.0", "s", "0.00")))
+        self.assertEqual("1.50", Xlsx2Csv.cell_to_str(cell(1.5, "n", "0.00")))
+
     def test_mysql_dump(self):
         reader = CsvParser()
         retval = list(reader(self.test_dir / "mysql-dump.tsv",
@@ -38,6 +38,15 @@ class TupleAdapterTestCase(unittest.TestCase):
         self.assertEqual("Sky", output_records[1].pilot_last_name)
         self.assertEqual("Chase", output_records[1].passenger_last_name)
 
+        recs, rec_type2 = adapter.apply_to(records, Rec)
+        self.assertIs(rec_type, rec_type2)
+        self.assertListEqual(output_records, list(recs))
+
+        convert = adapter.create_row_function()
+        self.assertIsNot(adapter, convert)
+        for rec in records:
+            self.assertEqual(adapter(rec), convert(rec))
+
     def test_datetime_adapter(self):
         Rec = namedtuple("Rec",
                          ["launch_location",
@@ -69,6 +78,17 @@ class TupleAdapterTestCase(unittest.TestCase):
         self.assertEqual("2022-01-01 23:55", output_records[1].begin)
         self.assertEqual("2022-01-02 01:01", output_records[1].end)
 
+    def test_datetime_adapter_strip(self):
+        Rec = namedtuple("Rec", ["begin_date", "begin_time"])
+        records = [Rec(" 2021-12-14", "13:22 ")]
+        recs, _ = DateTimeAdapter(strip=True).apply_to(records)
+        self.assertEqual("2021-12-14 13:22", next(iter(recs)).begin)
+        adapter = DateTimeAdapter(delimiter="T")
+        recs, _ = adapter.apply_to(records)
+        self.assertEqual(" 2021-12-14T13:22 ", next(iter(recs)).begin)
+        self.assertEqual(adapter(records[0]),
+                         adapter.create_row_function()(records[0]))
+
     def test_datetime_adapter_with_single_date(self):
         Rec = namedtuple("Rec",
                          ["launch_location",
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 
+import re
 import unittest
 from fsgop.db.utils import ASCII, iter_attrs, copy_attrs, all_attrs_equal
-from fsgop.db.utils import get_value, set_value, chunk
+from fsgop.db.utils import ascii_fold, ascii_fold_bytes
+from fsgop.db.utils import get_value, set_value, chunk, from_str, to, Sequence
+from fsgop.db.utils import kwargs_from, compile_layout, _date_from_slices
+from collections import namedtuple
+from datetime import date, datetime
 
 
 class MyClass(object):
@@ -43,6 +48,46 @@ class UtilsTestCase(unittest.TestCase):
 
         for asc, ger in zip(ascii, german):
             self.assertEqual(asc, ger.translate(ASCII))
+            self.assertEqual(asc, ascii_fold(ger))
+            self.assertEqual(asc, ascii_fold_bytes(ger.encode("utf-8")))
+            self.assertEqual(asc, ascii_fold_bytes(ger.encode("latin-1"),
+                                                   encoding="latin-1"))
+            self.assertEqual(asc, ascii_fold_bytes(ger.encode("utf-16-le"),
+                                                   encoding="utf-16-le"))
+
+    def test_from_str(self):
+        self.assertEqual("abc", from_str("abc", str))
+        self.assertEqual(12, from_str("12", int))
+        self.assertEqual(datetime(2022, 4, 7, 13, 5, 0),
+                         from_str("2022-04-07 13:05:00", datetime))
+        self.assertEqual(datetime(2022, 4, 7, 3, 5, 0),
+                         from_str("2022-4-7 3:05:00", datetime))
+        self.assertIsNone(from_str("", datetime))
+        self.assertRaises(ValueError, from_str, "2022-04-07T13:05:00", datetime)
+        self.assertEqual(date(2022, 4, 7), from_str("2022-04-07", date))
+        self.assertEqual(date(2022, 4, 7), from_str("2022-4-7", date))
+        self.assertEqual(date(2022, 4, 7), _date_from_slices("2022-04-07"))
+        self.assertRaises(ValueError, _date_from_slices, "2022-+4-07")
+        self.assertEqual(date(2022, 4, 7),
+                         from_str("07.04.2022", date, date_fmt="%d.%m.%Y"))
+        self.assertRaises(ValueError, from_str, "2022-04-07 13:05", date)
+        self.assertRaises(ValueError, from_str, "2022-W14-4", date)
+
+    def test_to(self):
+        c = MyClass()
+        self.assertIs(c, to(MyClass, c))
+        self.assertIs(c, to(object, c))
+        self.assertEqual(5, to(int, "5"))
+        self.assertEqual("a", to(object, "a"))
+        self.assertEqual(date(2022, 4, 7), to(date, "2022-04-07"))
+        self.assertEqual(12, to(lambda x: 2 * int(x), "6"))
+        self.assertEqual(2, to(MyClass, {"second": 2}).second)
+        self.assertEqual(2, to(MyClass, ("a", 2)).second)
+        Rec = namedtuple("Rec", ["third", "second"])
+        self.assertEqual(2, to(MyClass, Rec(third=1, second=2)).second)
+        self.assertIsNone(to(int, None, default=None))
+        self.assertRaises(ValueError, to, int, None)
+        self.assertEqual(3, to(int, 3.5))
 
     def test_iter_attrs(self):
         c = MyClass()
@@ -83,9 +128,26 @@ class UtilsTestCase(unittest.TestCase):
         self.assertFalse(all_attrs_equal(c1, c3))
         self.assertFalse(all_attrs_equal(c2, c3))
 
+        c4 = MyClass()
+        self.assertTrue(all_attrs_equal(c1, c4))
+        c4.fifth = 5
+        self.assertTrue(all_attrs_equal(c1, c4))
+        self.assertFalse(all_attrs_equal(c4, c1))
+
     def test_get_value(self):
         comment = "email='harry.hopper@home.net'"
         self.assertEqual("harry.hopper@home.net", get_value(comment, "email"))
+        comment = "my_email='a@b.c'; email='d@e.f'; e.mail='g@h.i'"
+        self.assertEqual("d@e.f", get_value(comment, "email"))
+        self.assertEqual("g@h.i", get_value(comment, "e.mail"))
+        self.assertEqual("", get_value("email=''", "email"))
+        self.assertIsNone(get_value("emails='a@b.c'", "email"))
+
+        # custom patterns with and without a key group
+        pattern = re.compile(r"(e-?mail)\s*[=:]\s*'([^']+)'")
+        self.assertEqual("d@e.f", get_value("e-mail='d@e.f'", pattern))
+        pattern = re.compile(r"e-?mail\s*[=:]\s*'([^']+)'")
+        self.assertEqual("d@e.f", get_value("e-mail='d@e.f'", pattern))
 
     def test_set_value(self):
         self.assertEqual("key='a value'", set_value("key", "a value"))
@@ -98,9 +160,36 @@ class UtilsTestCase(unittest.TestCase):
                                    None,
                                    "key1 = 'value 1'; key2= 'value two'"))
 
+    def test_sequence(self):
+        seq = Sequence(x for x in range(3))
+        self.assertTrue(seq)
+        self.assertIs(int, seq.element_type)
+        self.assertListEqual([0, 1, 2], list(seq))
+        self.assertListEqual([], list(seq))
+        seq = Sequence([])
+        self.assertFalse(seq)
+        self.assertIsNone(seq.element_type)
+        self.assertListEqual([], list(seq))
+
+    def test_compile_layout(self):
+        c = MyClass()
+        layout = {"a": "first", "b": {"c": "second", "d": "third"}}
+        self.assertDictEqual(kwargs_from(c, layout),
+                             compile_layout(layout)(c))
+        layout["b"]["e"] = "fifth"
+        with self.assertRaises(AttributeError):
+            compile_layout(layout)(c)
+        expected = {"a": "first", "b": {"c": 2, "d": 3., "e": None}}
+        self.assertDictEqual(expected, kwargs_from(c, layout, None))
+        self.assertDictEqual(expected, compile_layout(layout, None)(c))
+
     def test_chunk(self):
         for i, packet in enumerate(chunk(range(50), 10)):
             self.assertListEqual(list(range(10*i, 10*(i+1))), list(packet))
+        packets = list(chunk(range(25), 10))
+        self.assertListEqual([list(range(20, 25))], packets[2:])
+        for i, packet in enumerate(chunk(range(50), 10, materialize=False)):
+            self.assertListEqual(list(range(10*i, 10*(i+1))), list(packet))
 
         for i, packet in enumerate(chunk(range(55), 10)):
             if i < 5:
@@ -23,6 +23,60 @@ class VehicleTestCase(unittest.TestCase):
         self.assertEqual("G 103 123456", v1.serial_number)
         self.assertEqual(2, v1.num_seats)
 
+    def test_from_columns(self):
+        vehicles = Vehicle.from_columns(
+            uid=[1, "2"],
+            manufacturer=["Grob", None],
+            model=["G 103", "ASK 21"],
+            num_seats=[1, "2"],
+            category=["glider", 4]
+        )
+        expected = [
+            Vehicle(uid=1, manufacturer="Grob", model="G 103",
+                    category="glider"),
+            Vehicle(uid=2, model="ASK 21", num_seats=2, category=4)
+        ]
+        self.assertEqual(len(expected), len(vehicles))
+        for v, e in zip(vehicles, expected):
+            self.assertIs(Vehicle, type(v))
+            for name in ("uid", "manufacturer", "model", "serial_number",
+                         "num_seats", "category", "comments"):
+                self.assertEqual(getattr(e, name), getattr(v, name))
+            self.assertFalse(v.has_properties)
+
+        # missing values as returned by pandas.Series.tolist
+        vehicles = Vehicle.from_columns(num_seats=[None, float("nan"), 2.0],
+                                        registration=["D-1234", None,
+                                                      float("nan")])
+        self.assertListEqual([None, None, 2], [v.num_seats for v in vehicles])
+        self.assertListEqual(["D-1234", None, None],
+                             [v.registration for v in vehicles])
+        reg = next(iter(vehicles[0]["registration"]))
+        self.assertIs(vehicles[0], reg.rec)
+        self.assertFalse(vehicles[1].has_properties)
+        with self.assertRaises(ValueError):
+            Vehicle.from_columns()
+        with self.assertRaises(ValueError):
+            Vehicle.from_columns(uid=[1, 2], model=["G 103"])
+        vehicles = Vehicle.from_columns(uid=iter([1, 2]), model=("a", "b"))
+        self.assertListEqual([1, 2], [v.uid for v in vehicles])
+
+    def test_slots(self):
+        v = Vehicle(uid=1, manufacturer="Grob", registration="D-1234")
+        self.assertFalse(hasattr(v, "__dict__"))
+        reg = next(iter(v["registration"]))
+        self.assertFalse(hasattr(reg, "__dict__"))
+        self.assertEqual([("", v)], list(v.select(Vehicle)))
+        self.assertEqual([("", reg)], list(reg.select(VehicleProperty)))
+        self.assertEqual([("rec", v)], list(reg.select(Vehicle)))
+
+    def test_interned_strings(self):
+        v1 = Vehicle(manufacturer="".join(["Schleicher"]), model="ASK 21")
+        v2, = Vehicle.from_columns(manufacturer=["".join(["Schleic", "her"])],
+                                   model=[" ".join(["ASK", "21"])])
+        self.assertIs(v1.manufacturer, v2.manufacturer)
+        self.assertIs(v1.model, v2.model)
+
     def test_layout(self):
         layout = {
             "uid": "uid",
@@ -61,6 +115,15 @@ class VehicleTestCase(unittest.TestCase):
 
         self.assertDictEqual(layout, VehicleProperty.layout())
 
+    def test_licences(self):
+        v = Vehicle(manufacturer="Grob", category="glider")
+        self.assertSetEqual({"SPL", "LAPL(S)"}, v.pic_licences)
+        self.assertSetEqual({"FI(S)"}, v.instructor_licences)
+
+        v = Vehicle(manufacturer="Schempp-Hirth", category="motor glider")
+        self.assertSetEqual(set(), v.pic_licences)
+        self.assertSetEqual(set(), v.instructor_licences)
+
     def test_is_glider(self):
         v = Vehicle(manufacturer="Grob",
                     category="glider",